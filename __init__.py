@@ -45,6 +45,10 @@ bl_info = {
 if "bpy" in locals():
     import importlib
 
+    # Modules imported by other modules first, so those bind to the reloaded ones
+    importlib.reload(pdt_functions)
+    importlib.reload(pdt_cad_module)
+    importlib.reload(pdt_jobs)
     importlib.reload(pdt_design)
     importlib.reload(pdt_pivot_point)
     importlib.reload(pdt_menus)
@@ -53,7 +57,13 @@ if "bpy" in locals():
     importlib.reload(pdt_xall)
     importlib.reload(pdt_bix)
     importlib.reload(pdt_etof)
+    importlib.reload(pdt_tjunction)
+    importlib.reload(pdt_command)
+    importlib.reload(pdt_headless)
 else:
+    from . import pdt_functions
+    from . import pdt_cad_module
+    from . import pdt_jobs
     from . import pdt_design
     from . import pdt_pivot_point
     from . import pdt_menus
@@ -62,11 +72,14 @@ else:
     from . import pdt_xall
     from . import pdt_bix
     from . import pdt_etof
+    from . import pdt_tjunction
+    from . import pdt_command
+    from . import pdt_headless
 
 import bpy
 import os
 from pathlib import Path
-from bpy.types import AddonPreferences, PropertyGroup, Scene, WindowManager
+from bpy.types import AddonPreferences, Object, PropertyGroup, Scene, Text, WindowManager
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
@@ -78,13 +91,21 @@ from bpy.props import (
     StringProperty,
 )
 from .pdt_msg_strings import (
+    PDT_DES_BISECTPAIRS,
+    PDT_DES_CMDFILE,
+    PDT_DES_CMDTEXT,
     PDT_DES_COORDS,
+    PDT_DES_ETOFOBJECT,
+    PDT_DES_ETOFTARGET,
     PDT_DES_FILLETPROF,
     PDT_DES_FILLETRAD,
     PDT_DES_FILLETSEG,
     PDT_DES_FILLETVERTS,
     PDT_DES_FLIPANG,
     PDT_DES_FLIPPER,
+    PDT_DES_JOURNAL,
+    PDT_DES_JOURNALFILE,
+    PDT_DES_JOURNALTEXT,
     PDT_DES_LIBCOLS,
     PDT_DES_LIBMATS,
     PDT_DES_LIBMODE,
@@ -96,6 +117,7 @@ from .pdt_msg_strings import (
     PDT_DES_OFFDIS,
     PDT_DES_OFFPER,
     PDT_DES_OPMODE,
+    PDT_DES_PIVOTCENTRE,
     PDT_DES_PIVOTDIS,
     PDT_DES_PPLOC,
     PDT_DES_PPSCALEFAC,
@@ -103,9 +125,14 @@ from .pdt_msg_strings import (
     PDT_DES_PPTRANS,
     PDT_DES_PPWIDTH,
     PDT_DES_ROTMOVAX,
+    PDT_DES_TAPERAXIS,
+    PDT_DES_TAPERMOVE,
+    PDT_DES_TJUNCDIST,
     PDT_DES_TRIM,
     PDT_DES_VALIDLET,
-    PDT_DES_WORPLANE
+    PDT_DES_WORPLANE,
+    PDT_DES_XALLCUT,
+    PDT_DES_XALLWORKERS
 )
 from .pdt_command import command_run
 from .pdt_functions import scale_set
@@ -297,11 +324,22 @@ class PDTSceneProperties(PropertyGroup):
             ("RY-MZ", "RotY-MovZ", "Rotate Y - Move Z"),
             ("RZ-MX", "RotZ-MovX", "Rotate Z - Move X"),
             ("RZ-MY", "RotZ-MovY", "Rotate Z - Move Y"),
+            (
+                "CUSTOM",
+                "Custom",
+                "Rotate about Custom Axis through Pivot Point - Move along Custom Direction",
+            ),
         ),
         name="Axes",
         default="RX-MY",
         description=PDT_DES_ROTMOVAX,
     )
+    taper_axis : FloatVectorProperty(
+        name="Taper Axis", default=(1.0, 0.0, 0.0), subtype="XYZ", description=PDT_DES_TAPERAXIS
+    )
+    taper_move : FloatVectorProperty(
+        name="Taper Move", default=(0.0, 1.0, 0.0), subtype="XYZ", description=PDT_DES_TAPERMOVE
+    )
 
     flip_angle : BoolProperty(
         name="Flip Angle", default=False, description=PDT_DES_FLIPANG
@@ -314,6 +352,54 @@ class PDTSceneProperties(PropertyGroup):
         name="Trim/Extend All", default=False, description=PDT_DES_TRIM
     )
 
+    bisect_pairs : EnumProperty(
+        items=(
+            ("SELECTED", "Selected Edges", "Bisect the 2 Selected Edges"),
+            ("VERTEX", "Around Vertices", "Bisect every Pair of Adjacent Edges around each Selected Vertex"),
+            ("HISTORY", "Selection History", "Bisect each Edge in the Selection History with the next one"),
+        ),
+        name="Bisect Pairs",
+        default="SELECTED",
+        description=PDT_DES_BISECTPAIRS,
+    )
+
+    etof_target : EnumProperty(
+        items=(
+            ("PLANE", "Face Plane", "Extend 1 Selected Edge to the Plane of the Selected Face"),
+            ("FACES", "Selected Faces", "Extend all Selected Loose Edges to the Nearest Selected Face"),
+            ("OBJECT", "Target Object", "Extend all Selected Loose Edges to the Nearest Face of the Target Object"),
+        ),
+        name="Extend To",
+        default="PLANE",
+        description=PDT_DES_ETOFTARGET,
+    )
+    etof_object : PointerProperty(
+        type=Object,
+        name="Target Object",
+        poll=lambda self, ob: ob.type == "MESH",
+        description=PDT_DES_ETOFOBJECT,
+    )
+
+    intersect_cutters : EnumProperty(
+        items=(
+            ("NONE", "All Edges", "Intersect all Selected Edges with each other"),
+            ("GROUP", "Vertex Group", "Cut Selected Edges only with Edges in the Active Vertex Group"),
+            ("HISTORY", "Selection History", "Cut Selected Edges only with Edges in the Selection History"),
+        ),
+        name="Cutters",
+        default="NONE",
+        description=PDT_DES_XALLCUT,
+    )
+
+    tjunction_dist : FloatProperty(
+        name="T-Junction Tolerance",
+        min=0.00001,
+        default=0.0001,
+        precision=5,
+        description=PDT_DES_TJUNCDIST,
+        unit="LENGTH",
+    )
+
     lib_objects : EnumProperty(
         items=enumlist_objects, name="Objects", description=PDT_DES_LIBOBS
     )
@@ -359,6 +445,17 @@ class PDTSceneProperties(PropertyGroup):
         description=PDT_DES_VALIDLET,
     )
     error : StringProperty(name="Error", default="")
+    command_text : PointerProperty(type=Text, name="Command Script", description=PDT_DES_CMDTEXT)
+    command_file : StringProperty(
+        name="Command File", default="", subtype="FILE_PATH", description=PDT_DES_CMDFILE
+    )
+    journal_record : BoolProperty(
+        name="Record Journal", default=False, description=PDT_DES_JOURNAL
+    )
+    journal_text : PointerProperty(type=Text, name="Journal", description=PDT_DES_JOURNALTEXT)
+    journal_file : StringProperty(
+        name="Journal File", default="", subtype="FILE_PATH", description=PDT_DES_JOURNALFILE
+    )
 
     # Was pivot* -- is now pivot_*
     pivot_loc : FloatVectorProperty(
@@ -394,6 +491,16 @@ class PDTSceneProperties(PropertyGroup):
         description=PDT_DES_PPTRANS,
     )
     pivot_show : BoolProperty()
+    pivot_centre : EnumProperty(
+        items=(
+            ("MEDIAN", "Median", "Mean of the Selected Vertices"),
+            ("BOUNDS", "Bounding Box", "Centre of the Selected Vertices' Bounding Box"),
+            ("AREA", "Face Area", "Area weighted Centroid of the Selected Faces"),
+        ),
+        name="Pivot Centre",
+        default="MEDIAN",
+        description=PDT_DES_PIVOTCENTRE,
+    )
 
     # Was filletrad
     fillet_radius : FloatProperty(
@@ -430,14 +537,21 @@ class PDTPreferences(AddonPreferences):
         description="NOTE: Does not enable debugging globally in Blender (only in PDT scripts)"
     )
 
+    pdt_xall_workers : IntProperty(
+        name="Intersect All Worker Processes", min=1, max=64, default=1,
+        description=PDT_DES_XALLWORKERS
+    )
+
     def draw(self, context):
         layout = self.layout
 
         box = layout.box()
         row1 = box.row()
         row2 = box.row()
+        row3 = box.row()
         row1.prop(self, "debug")
         row2.prop(self, "pdt_library_path")
+        row3.prop(self, "pdt_xall_workers")
 
 
 # List of All Classes in the Add-on to register
@@ -449,6 +563,8 @@ classes = (
     PDTSceneProperties,
     PDTPreferences,
     pdt_bix.PDT_OT_LineOnBisection,
+    pdt_command.PDT_OT_CommandScript,
+    pdt_command.PDT_OT_JournalReplay,
     pdt_design.PDT_OT_PlacementAbs,
     pdt_design.PDT_OT_PlacementDelta,
     pdt_design.PDT_OT_PlacementDis,
@@ -489,6 +605,9 @@ classes = (
     pdt_view.PDT_OT_viso,
     pdt_view.PDT_OT_Reset3DView,
     pdt_xall.PDT_OT_IntersectAllEdges,
+    pdt_xall.PDT_OT_IntersectAllPreview,
+    pdt_xall.PDT_OT_IntersectAllObjects,
+    pdt_tjunction.PDT_OT_RepairTJunctions,
 )
 
 
@@ -509,6 +628,13 @@ def register():
     # Register Internal OpenGL Property
     #
     wm.pdt_run_opengl = BoolProperty(default=False)
+    # Register Intersect All Preview Property
+    #
+    wm.pdt_xall_preview = BoolProperty(default=False)
+    # Register the Name & Progress of the Running Job
+    #
+    wm.pdt_job_name = StringProperty(default="")
+    wm.pdt_job_progress = FloatProperty(default=0.0, min=0.0, max=1.0, subtype="FACTOR")
 
     Scene.pdt_pg = PointerProperty(type=PDTSceneProperties)
 
@@ -525,10 +651,13 @@ def unregister():
     pdt_pivot_point.PDT_OT_ModalDrawOperator.handle_remove(
         pdt_pivot_point.PDT_OT_ModalDrawOperator, bpy.context
     )
+    pdt_xall.PDT_OT_IntersectAllPreview.handle_remove(
+        pdt_xall.PDT_OT_IntersectAllPreview, bpy.context
+    )
     wm = bpy.context.window_manager
-    p = "pdt_run_opengl"
-    if p in wm:
-        del wm[p]
+    for p in ("pdt_run_opengl", "pdt_xall_preview", "pdt_job_name", "pdt_job_progress"):
+        if p in wm:
+            del wm[p]
 
     for cls in reversed(classes):
         unregister_class(cls)
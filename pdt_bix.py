@@ -26,12 +26,77 @@
 #
 import bpy
 import bmesh
+import numpy as np
+from math import atan2, pi
 from . import pdt_cad_module as cm
-from .pdt_msg_strings import PDT_ERR_2CPNPE, PDT_ERR_NCEDGES
-from .pdt_functions import debug
+from .pdt_msg_strings import PDT_ERR_2CPNPE, PDT_ERR_NCEDGES, PDT_ERR_NO_BISECT
+from .pdt_functions import debug, merge_verts
+
+def order_edges_around(vert, edges):
+    """Order Edges by Angle around a Vertex.
+
+    Args:
+        vert:         BMVert shared by the edges
+        edges:        list of BMEdges using vert.
+
+    Returns:
+        The edges sorted counter-clockwise around the vertex normal, or around the
+        normal of the first two non-parallel edges for loose geometry.
+    """
+
+    dirs = [(e.other_vert(vert).co - vert.co).normalized() for e in edges]
+    axis = vert.normal.copy()
+    if axis.length < 1.0e-6:
+        axis = next(
+            (d1.cross(d2) for d1 in dirs for d2 in dirs if d1.cross(d2).length > 1.0e-6),
+            None,
+        )
+        if axis is None:
+            return edges
+    ref = dirs[0]
+
+    def angle(d):
+        return atan2(axis.dot(ref.cross(d)), ref.dot(d)) % (2 * pi)
+
+    return [e for _, e in sorted(zip(map(angle, dirs), edges), key=lambda x: x[0])]
+
+
+def get_bisection_pairs(bm, mode):
+    """Return Pairs of Edges to Bisect.
+
+    Args:
+        bm:           is a bmesh representation
+        mode:         "SELECTED" for the two selected edges, "VERTEX" for every
+                      consecutive pair of edges around each selected vertex, or
+                      "HISTORY" for consecutive edges in the selection history.
+
+    Returns:
+        List of (BMEdge, BMEdge) tuples.
+    """
+
+    if mode == "SELECTED":
+        edges = [e for e in bm.edges if e.select and not e.hide]
+        return [tuple(edges)] if len(edges) == 2 else []
+    if mode == "HISTORY":
+        edges = [e for e in bm.select_history if isinstance(e, bmesh.types.BMEdge)]
+        return list(zip(edges, edges[1:]))
+    pairs = []
+    for v in bm.verts:
+        if not v.select or v.hide:
+            continue
+        edges = order_edges_around(v, [e for e in v.link_edges if not e.hide])
+        if len(edges) == 2:
+            pairs.append(tuple(edges))
+        elif len(edges) > 2:
+            pairs.extend(zip(edges, edges[1:] + edges[:1]))
+    return pairs
+
 
 def add_line_to_bisection(self, context):
-    """Computes Bisector of 2 Co-Planar Edges.
+    """Computes Bisectors of Pairs of Co-Planar Edges.
+
+    All pairs are bisected in one array pass and the new edges are added in a
+    single bmesh update.
 
     Args:
         context: Blender bpy.context instance
@@ -47,50 +112,40 @@ def add_line_to_bisection(self, context):
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    edges = [e for e in bm.edges if e.select and not e.hide]
-
-    if not len(edges) == 2:
-        msg = PDT_ERR_2CPNPE
+    mode = context.scene.pdt_pg.bisect_pairs
+    edge_pairs = get_bisection_pairs(bm, mode)
+    if not edge_pairs:
+        msg = PDT_ERR_2CPNPE if mode == "SELECTED" else PDT_ERR_NO_BISECT
         self.report({"ERROR"}, msg)
         return
 
-    [[v1, v2], [v3, v4]] = [[v.co for v in e.verts] for e in edges]
-    debug(f"vectors found:\n {v1}\n {v2}\n {v3}\n {v4}")
-
-    dist1 = (v1 - v2).length
-    dist2 = (v3 - v4).length
-    bdist = min([dist1, dist2])
-    edge1 = (v1, v2)
-    edge2 = (v3, v4)
+    edges = list(dict.fromkeys(e for pair in edge_pairs for e in pair))
+    index = {e: i for i, e in enumerate(edges)}
+    coords = np.array([[v.co[:] for v in e.verts] for e in edges], dtype=np.float64)
+    pairs = np.array([(index[e1], index[e2]) for e1, e2 in edge_pairs], dtype=np.int64)
+    debug(f"bisecting {len(pairs)} pairs of {len(edges)} edges")
 
-    if not cm.test_coplanar(edge1, edge2):
+    points, valid = cm.bisect_edge_pairs(coords, pairs)
+    if not valid.any():
         msg = PDT_ERR_NCEDGES
         self.report({"ERROR"}, msg)
         return
 
-    # get pt and pick farthest vertex from (projected) intersections
-    pt = cm.get_intersection(edge1, edge2)
-    far1 = v2 if (v1 - pt).length < (v2 - pt).length else v1
-    far2 = v4 if (v3 - pt).length < (v4 - pt).length else v3
-
-    dex1 = far1 - pt
-    dex2 = far2 - pt
-    dex1 = dex1 * (bdist / dex1.length)
-    dex2 = dex2 * (bdist / dex2.length)
-    pt2 = pt + (dex1).lerp(dex2, 0.5)
-    pt3 = pt2.lerp(pt, 2.0)
-
-    vec1 = bm.verts.new(pt2)
-    vec2 = bm.verts.new(pt)
-    vec3 = bm.verts.new(pt3)
-    bm.edges.new((vec1, vec2))
-    bm.edges.new((vec2, vec3))
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+    new_verts = []
+    for pt2, pt, pt3 in points[valid].tolist():
+        vec1 = bm.verts.new(pt2)
+        vec2 = bm.verts.new(pt)
+        vec3 = bm.verts.new(pt3)
+        bm.edges.new((vec1, vec2))
+        bm.edges.new((vec2, vec3))
+        new_verts.extend((vec1, vec2, vec3))
+    # The source edges' vertices are preferred, the new lines may also land on others
+    merge_verts(bm, [v for e in edges for v in e.verts] + new_verts, neighbours=True)
     bmesh.update_edit_mesh(me)
 
 
 class PDT_OT_LineOnBisection(bpy.types.Operator):
-    """Create Bisector between 2 Selected Edges."""
+    """Create Bisectors between Pairs of Selected Edges."""
 
     bl_idname = "pdt.linetobisect"
     bl_label = "Add Edges Bisector"
@@ -105,7 +160,7 @@ class PDT_OT_LineOnBisection(bpy.types.Operator):
         return all([ob is not None, ob.type == "MESH", ob.mode == "EDIT"])
 
     def execute(self, context):
-        """Computes Bisector of 2 Co-Planar Edges.
+        """Computes Bisectors of Pairs of Co-Planar Edges.
 
         Args:
             context: Blender bpy.context instance.
@@ -24,6 +24,8 @@
 # ----------------------------------------------------------
 #
 import bmesh
+import numpy as np
+from itertools import chain
 from mathutils import Vector
 from mathutils.geometry import intersect_line_line, intersect_point_line
 from .pdt_functions import debug
@@ -205,6 +207,452 @@ def find_intersecting_edges(bm, pt, idx1, idx2):
     return [idx for edge, idx in zip(edges, idxs) if point_on_edge(pt, edge)]
 
 
+class GeometrySnapshot:
+    """Contiguous Array Copy of Mesh Geometry.
+
+    Holds every vertex coordinate and every edge's vertex index pair, read in one
+    pass, so operators can look up any number of elements with array indexing
+    instead of one bmesh lookup per element. Element indices are those of the
+    source at the time the snapshot was taken.
+
+    Attributes:
+        verts:        (V, 3) float64 array of vertex coordinates
+        edges:        (E, 2) int32 array of edge vertex indices
+        vert_select:  (V,) bool array of vertex selection states
+        edge_select:  (E,) bool array of edge selection states
+    """
+
+    def __init__(self, verts, edges, vert_select, edge_select):
+        self.verts = verts
+        self.edges = edges
+        self.vert_select = vert_select
+        self.edge_select = edge_select
+
+    @classmethod
+    def from_bmesh(cls, bm):
+        """Take a Snapshot of a BMesh.
+
+        Args:
+            bm:           is a bmesh representation, its indices are updated.
+
+        Returns:
+            GeometrySnapshot instance.
+        """
+
+        bm.verts.index_update()
+        bm.edges.index_update()
+        num_verts = len(bm.verts)
+        num_edges = len(bm.edges)
+        verts = np.fromiter(
+            chain.from_iterable(v.co for v in bm.verts), dtype=np.float64, count=num_verts * 3
+        ).reshape(-1, 3)
+        edges = np.fromiter(
+            chain.from_iterable((e.verts[0].index, e.verts[1].index) for e in bm.edges),
+            dtype=np.int32,
+            count=num_edges * 2,
+        ).reshape(-1, 2)
+        vert_select = np.fromiter((v.select for v in bm.verts), dtype=bool, count=num_verts)
+        edge_select = np.fromiter((e.select for e in bm.edges), dtype=bool, count=num_edges)
+        return cls(verts, edges, vert_select, edge_select)
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        """Take a Snapshot of Mesh Data using foreach_get.
+
+        Args:
+            mesh:         bpy.types.Mesh, not in Edit mode.
+
+        Returns:
+            GeometrySnapshot instance.
+        """
+
+        verts = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", verts)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        vert_select = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get("select", vert_select)
+        edge_select = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("select", edge_select)
+        return cls(verts.reshape(-1, 3), edges.reshape(-1, 2), vert_select, edge_select)
+
+    def transformed(self, matrix):
+        """Return a Copy with the Coordinates multiplied by a 4x4 Matrix."""
+        mat = np.array(matrix, dtype=np.float64)
+        verts = self.verts @ mat[:3, :3].T + mat[:3, 3]
+        return GeometrySnapshot(verts, self.edges, self.vert_select, self.edge_select)
+
+    def selected_verts(self):
+        """Return the Indices of the Selected Vertices."""
+        return np.flatnonzero(self.vert_select)
+
+    def selected_edges(self):
+        """Return the Indices of the Selected Edges."""
+        return np.flatnonzero(self.edge_select)
+
+    def vert_coords(self, vert_indices):
+        """Return (N, 3) Vertex Coordinates, array version of vectors_from_indices."""
+        return self.verts[np.asarray(vert_indices, dtype=np.int64)]
+
+    def edge_coords(self, edge_indices):
+        """Return (N, 2, 3) Edge Coordinates, array version of coords_tuple_from_edge_idx."""
+        return self.verts[self.edge_verts(edge_indices)]
+
+    def edge_verts(self, edge_indices):
+        """Return (N, 2) Edge Vertex Indices, array version of vertex_indices_from_edges_tuple."""
+        return self.edges[np.asarray(edge_indices, dtype=np.int64)].reshape(-1, 2)
+
+
+def set_vert_coords(bm, vert_indices, coords):
+    """Write (N, 3) Coordinates back to BMesh Vertices, counterpart of vert_coords.
+
+    Args:
+        bm:           is a bmesh representation, indexed as its GeometrySnapshot
+        vert_indices: array of vertex indices
+        coords:       (N, 3) array of their new coordinates.
+
+    Returns:
+        Nothing.
+    """
+
+    bm.verts.ensure_lookup_table()
+    for idx, co in zip(np.asarray(vert_indices).tolist(), np.asarray(coords).tolist()):
+        bm.verts[idx].co = co
+
+
+def closest_line_points(coords, pairs):
+    """Closest Points between the Lines through Pairs of Edges.
+
+    Batched equivalent of line_from_edge_intersect.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of indices into coords.
+
+    Returns:
+        (P, 3) arrays of the closest points on the first and on the second line,
+        (P,) array of the first point's factor along the first edge,
+        (P,) bool mask, False where the lines are parallel or an edge has no length.
+    """
+
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    p1 = coords[pairs[:, 0], 0]
+    d1 = coords[pairs[:, 0], 1] - p1
+    p3 = coords[pairs[:, 1], 0]
+    d2 = coords[pairs[:, 1], 1] - p3
+    r = p1 - p3
+
+    # fmt: off
+    a = np.einsum("ij,ij->i", d1, d1)
+    b = np.einsum("ij,ij->i", d1, d2)
+    c = np.einsum("ij,ij->i", d1, r)
+    e = np.einsum("ij,ij->i", d2, d2)
+    f = np.einsum("ij,ij->i", d2, r)
+    denom = a*e - b*b
+    # fmt: on
+    # Parallel and zero length edges have no single closest point
+    valid = denom > 1.0e-12 * a * e
+    denom = np.where(valid, denom, 1.0)
+    s = (b * f - c * e) / denom
+    t = (a * f - b * c) / denom
+    return p1 + s[:, None] * d1, p3 + t[:, None] * d2, s, valid
+
+
+def intersect_edge_pairs(coords, pairs, tol=1.0e-5):
+    """Intersect Pairs of Edges in one Array Pass.
+
+    Batched equivalent of calling intersect_line_line for every pair and keeping the
+    result only when the point lies on both edges (see point_on_edge).
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of indices into coords
+        tol:          distance under which points are considered coincident.
+
+    Returns:
+        (P, 3) array of intersection points on the first edge of each pair,
+        (P, 2) array of the points' factors along the first and second edge,
+        (P,) bool mask, True where the point lies on both edges.
+    """
+
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    closest_a, closest_b, s, valid = closest_line_points(coords, pairs)
+    p3 = coords[pairs[:, 1], 0]
+    d2 = coords[pairs[:, 1], 1] - p3
+    e = np.einsum("ij,ij->i", d2, d2)
+
+    # Project the point back onto the second edge as point_on_edge does
+    t2 = np.einsum("ij,ij->i", closest_a - p3, d2) / np.where(valid, e, 1.0)
+    off_edge = np.linalg.norm(p3 + t2[:, None] * d2 - closest_a, axis=1)
+    gap = np.linalg.norm(closest_a - closest_b, axis=1)
+
+    mask = (
+        valid
+        & (s >= 0.0) & (s <= 1.0)
+        & (t2 >= 0.0) & (t2 <= 1.0)
+        & (off_edge < tol)
+        & (gap <= tol)
+    )
+    return closest_a, np.column_stack((s, t2)), mask
+
+
+def bisect_edge_pairs(coords, pairs, tol=1.0e-5):
+    """Bisect Pairs of Co-Planar Edges in one Array Pass.
+
+    Batched version of the Bisect tool: the bisector runs through the intersection
+    of the two lines, between the edges' far ends, and reaches as far as the
+    shorter edge on either side of the intersection.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of indices into coords
+        tol:          distance under which lines are considered to intersect.
+
+    Returns:
+        (P, 3, 3) array of bisector start, intersection and end points,
+        (P,) bool mask, True where the edges are co-planar and not parallel.
+    """
+
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    closest_a, closest_b, _, valid = closest_line_points(coords, pairs)
+    valid &= np.linalg.norm(closest_a - closest_b, axis=1) < tol
+    pt = (closest_a + closest_b) / 2.0
+
+    edge1 = coords[pairs[:, 0]]
+    edge2 = coords[pairs[:, 1]]
+    bdist = np.minimum(
+        np.linalg.norm(edge1[:, 1] - edge1[:, 0], axis=1),
+        np.linalg.norm(edge2[:, 1] - edge2[:, 0], axis=1),
+    )
+
+    def far_direction(edge):
+        # Unit vector from the intersection to the edge's farther end
+        dists = np.linalg.norm(edge - pt[:, None], axis=2)
+        far = edge[np.arange(len(edge)), dists.argmax(axis=1)]
+        dex = far - pt
+        length = np.linalg.norm(dex, axis=1)
+        return dex / np.where(length > tol, length, 1.0)[:, None], length > tol
+
+    dex1, ok1 = far_direction(edge1)
+    dex2, ok2 = far_direction(edge2)
+    half = (dex1 + dex2) / 2.0 * bdist[:, None]
+    return np.stack((pt + half, pt, pt - half), axis=1), valid & ok1 & ok2
+
+
+def _grid_cells(mins, maxs):
+    """Register Boxes in the Cells of a Uniform Grid.
+
+    The cell size starts at the median box extent and is doubled until the number of
+    cell references stays proportional to the number of boxes, so a few long edges
+    cannot blow up the grid.
+
+    Args:
+        mins, maxs:   (N, 3) arrays of box minimum and maximum corners.
+
+    Returns:
+        Cell size, (R,) array of box indices and (R, 3) int64 array of the cells
+        each of them covers.
+    """
+
+    num = len(mins)
+    cell = max(float(np.median((maxs - mins).max(axis=1))), 1.0e-9)
+    while True:
+        # Count in floats, a long box among tiny ones overflows an int64 product
+        lo = np.floor(mins / cell)
+        dims = np.floor(maxs / cell) - lo + 1
+        if dims.prod(axis=1).sum() <= 8 * num + 1024:
+            break
+        cell *= 2.0
+    lo = lo.astype(np.int64)
+    dims = dims.astype(np.int64)
+    counts = dims.prod(axis=1)
+
+    # Expand every box into the cells it covers
+    box_ids = np.repeat(np.arange(num), counts)
+    offsets = np.cumsum(counts) - counts
+    k = np.arange(counts.sum()) - np.repeat(offsets, counts)
+    dx = dims[box_ids, 0]
+    dy = dims[box_ids, 1]
+    cells = np.column_stack(
+        (
+            lo[box_ids, 0] + k % dx,
+            lo[box_ids, 1] + (k // dx) % dy,
+            lo[box_ids, 2] + k // (dx * dy),
+        )
+    )
+    return cell, box_ids, cells
+
+
+def _cell_keys(*cell_arrays):
+    """Return one Integer Key per Cell, consistent across all the Arrays given."""
+    sizes = [len(cells) for cells in cell_arrays]
+    cells = np.concatenate(cell_arrays)
+    if not len(cells):
+        return [np.empty(0, dtype=np.int64) for _ in cell_arrays]
+    cells = cells - cells.min(axis=0)
+    span = cells.max(axis=0) + 1
+    if float(span[0]) * float(span[1]) * float(span[2]) < 2.0 ** 62:
+        keys = cells[:, 0] + span[0] * (cells[:, 1] + span[1] * cells[:, 2])
+    else:
+        _, keys = np.unique(cells, axis=0, return_inverse=True)
+        keys = keys.ravel()
+    return np.split(keys, np.cumsum(sizes)[:-1])
+
+
+def overlapping_bounds(mins, maxs, pad=1.0e-4):
+    """Find Pairs of Overlapping Bounding Boxes using a Uniform Grid.
+
+    Each box is registered in every grid cell it covers, only boxes sharing a cell
+    are compared.
+
+    Args:
+        mins, maxs:   (N, 3) arrays of box minimum and maximum corners
+        pad:          distance added to every side of the boxes.
+
+    Returns:
+        (P, 2) int64 array of index pairs (i < j), sorted, whose padded boxes overlap.
+    """
+
+    num = len(mins)
+    if num < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    mins = np.asarray(mins, dtype=np.float64) - pad
+    maxs = np.asarray(maxs, dtype=np.float64) + pad
+    _, box_ids, cells = _grid_cells(mins, maxs)
+    (cell_ids,) = _cell_keys(cells)
+
+    # Pair every reference with the ones that follow it in the same cell
+    order = np.argsort(cell_ids, kind="stable")
+    cell_ids = cell_ids[order]
+    box_ids = box_ids[order]
+    starts = np.flatnonzero(np.r_[True, cell_ids[1:] != cell_ids[:-1]])
+    sizes = np.diff(np.r_[starts, len(cell_ids)])
+    remaining = np.repeat(starts + sizes, sizes) - np.arange(len(cell_ids))
+    first = []
+    second = []
+    active = np.flatnonzero(remaining > 1)
+    step = 1
+    while len(active):
+        first.append(box_ids[active])
+        second.append(box_ids[active + step])
+        step += 1
+        active = active[remaining[active] > step]
+    if not first:
+        return np.empty((0, 2), dtype=np.int64)
+    first = np.concatenate(first)
+    second = np.concatenate(second)
+    keys = np.minimum(first, second) * num + np.maximum(first, second)
+    keys = np.unique(keys[first != second])
+    pairs = np.column_stack((keys // num, keys % num))
+
+    # Cells only bucket the boxes, check the actual overlap
+    a, b = pairs[:, 0], pairs[:, 1]
+    overlap = np.all((mins[a] <= maxs[b]) & (mins[b] <= maxs[a]), axis=1)
+    return pairs[overlap]
+
+
+def points_in_bounds(points, mins, maxs, pad=1.0e-4):
+    """Find Points inside Bounding Boxes using a Uniform Grid.
+
+    The boxes are registered in a grid as for overlapping_bounds and every point is
+    hashed to the one cell holding it, so only boxes sharing that cell are tested.
+
+    Args:
+        points:       (M, 3) array of point coordinates
+        mins, maxs:   (N, 3) arrays of box minimum and maximum corners
+        pad:          distance added to every side of the boxes.
+
+    Returns:
+        (P, 2) int64 array of (point index, box index) pairs, sorted.
+    """
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if not len(points) or not len(mins):
+        return np.empty((0, 2), dtype=np.int64)
+    mins = np.asarray(mins, dtype=np.float64) - pad
+    maxs = np.asarray(maxs, dtype=np.float64) + pad
+    cell, box_ids, cells = _grid_cells(mins, maxs)
+    box_keys, point_keys = _cell_keys(cells, np.floor(points / cell).astype(np.int64))
+
+    # Look up the run of boxes registered in each point's cell
+    order = np.argsort(box_keys, kind="stable")
+    box_keys = box_keys[order]
+    box_ids = box_ids[order]
+    first = np.searchsorted(box_keys, point_keys, side="left")
+    counts = np.searchsorted(box_keys, point_keys, side="right") - first
+    point_ids = np.repeat(np.arange(len(points)), counts)
+    offsets = np.cumsum(counts) - counts
+    refs = np.repeat(first - offsets, counts) + np.arange(counts.sum())
+    pairs = np.column_stack((point_ids, box_ids[refs]))
+
+    p = points[pairs[:, 0]]
+    inside = np.all((mins[pairs[:, 1]] <= p) & (p <= maxs[pairs[:, 1]]), axis=1)
+    pairs = pairs[inside]
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def points_on_edges(points, coords, pairs, tol=1.0e-5):
+    """Test Points against Edges in one Array Pass.
+
+    Batched equivalent of point_on_edge that also rejects points at either end of
+    the edge, leaving only points on the edge's interior.
+
+    Args:
+        points:       (M, 3) array of point coordinates
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of (point index, edge index) pairs
+        tol:          distance under which points are considered on the edge.
+
+    Returns:
+        (P,) array of the points' factors along the edges,
+        (P,) bool mask, True where the point lies inside the edge.
+    """
+
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    p = points[pairs[:, 0]]
+    a = coords[pairs[:, 1], 0]
+    d = coords[pairs[:, 1], 1] - a
+    length_sq = np.einsum("ij,ij->i", d, d)
+    valid = length_sq > tol * tol
+    fac = np.einsum("ij,ij->i", p - a, d) / np.where(valid, length_sq, 1.0)
+    off_edge = np.linalg.norm(a + fac[:, None] * d - p, axis=1)
+    length = np.sqrt(length_sq)
+    mask = (
+        valid
+        & (off_edge < tol)
+        & (fac * length > tol)
+        & ((1.0 - fac) * length > tol)
+    )
+    return fac, mask
+
+
+def taper_offsets(points, pivot, axis, direction, tan_angle):
+    """Offsets that Taper Points about an Axis through a Pivot.
+
+    Each point moves along direction by its distance from the axis times
+    tan_angle, so points on the axis stay put.
+
+    Args:
+        points:       (N, 3) array of coordinates
+        pivot:        point on the axis
+        axis:         direction of the axis, need not be unit length
+        direction:    direction the points move in, need not be unit length
+        tan_angle:    tangent of the taper angle.
+
+    Returns:
+        (N, 3) array of offsets to add to points.
+    """
+
+    axis = np.asarray(axis, dtype=np.float64)
+    axis = axis / np.linalg.norm(axis)
+    direction = np.asarray(direction, dtype=np.float64)
+    direction = direction / np.linalg.norm(direction)
+    rel = points - np.asarray(pivot, dtype=np.float64)
+    radial = rel - np.outer(rel @ axis, axis)
+    distance = np.sqrt(np.einsum("ij,ij->i", radial, radial))
+    return np.outer(distance * tan_angle, direction)
+
+
 def vert_idxs_from_edge_idx(bm, idx):
     edge = bm.edges[idx]
     return edge.verts[0].index, edge.verts[1].index
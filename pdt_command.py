@@ -21,20 +21,32 @@
 # Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
 # -----------------------------------------------------------------------
 #
+import ast
 import bpy
 import bmesh
-from mathutils import Vector
+import numpy as np
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from mathutils import Matrix, Vector
 import math
 from .pdt_functions import (
+    checkSelection,
     debug,
     disAng,
     getPercent,
-    objCheck,
-    oops,
+    merge_verts,
+    report_error,
+    set_view_matrix,
     updateSel,
+    view_matrix,
 )
+from .pdt_jobs import JobOperator, run_job
 from .pdt_msg_strings import (
     PDT_ERR_ADDVEDIT,
+    PDT_ERR_ARRAY_COUNT,
+    PDT_ERR_ARRAY_OPER,
     PDT_ERR_BAD1VALS,
     PDT_ERR_BAD2VALS,
     PDT_ERR_BAD3VALS,
@@ -44,19 +56,129 @@ from .pdt_msg_strings import (
     PDT_ERR_BADSLETTER,
     PDT_ERR_CHARS_NUM,
     PDT_ERR_DUPEDIT,
+    PDT_ERR_EDOB_MODE,
     PDT_ERR_EXTEDIT,
     PDT_ERR_FACE_SEL,
     PDT_ERR_FILEDIT,
+    PDT_ERR_JOURNAL,
+    PDT_ERR_JOURNAL_LINE,
+    PDT_ERR_MATHS_NAME,
     PDT_ERR_NOCOMMAS,
     PDT_ERR_NON_VALID,
     PDT_ERR_NO_ACT_OBJ,
+    PDT_ERR_NO_JOURNAL,
+    PDT_ERR_NO_SCRIPT,
     PDT_ERR_NO_SEL_GEOM,
     PDT_ERR_SEL_1_EDGE,
     PDT_ERR_SEL_1_EDGEM,
+    PDT_ERR_SCRIPT_READ,
     PDT_ERR_SEL_1_VERT,
-    PDT_ERR_SPLITEDIT
+    PDT_ERR_SPLITEDIT,
+    PDT_ERR_VERT_MODE,
+    PDT_INF_SCRIPT,
+    PDT_LAB_SCRIPTLINE
 )
 
+# A compiled command line: operation letter, mode letter, numeric values, for
+# Maths commands the compiled expression, and the number of copies for arrays.
+Command = namedtuple("Command", ("oper", "mode", "vals", "expression", "count"), defaults=(1,))
+
+# Names available to Maths expressions; builtins are removed so an expression can
+# only reach the maths functions and constants and the PDT values below
+MATHS_GLOBALS = {name: value for name, value in vars(math).items() if not name.startswith("_")}
+MATHS_GLOBALS.update(abs=abs, max=max, min=min, round=round, __builtins__={})
+# Largest argument of the maths functions whose cost grows with their whole number
+# arguments; anything beyond overflows a float result anyway
+MATHS_WHOLE_MAX = 1000
+
+
+def _bounded(func):
+    """Wrap a Maths Function to refuse Arguments above MATHS_WHOLE_MAX."""
+
+    def bounded(*args):
+        if any(abs(arg) > MATHS_WHOLE_MAX for arg in args):
+            raise ValueError(f"{func.__name__} argument above {MATHS_WHOLE_MAX}")
+        return func(*args)
+
+    return bounded
+
+
+for _name in ("factorial", "comb", "perm"):
+    if _name in MATHS_GLOBALS:
+        MATHS_GLOBALS[_name] = _bounded(MATHS_GLOBALS[_name])
+# PDT values available to Maths expressions
+MATHS_VARIABLES = ("x", "y", "z", "distance", "angle", "percent")
+# Syntax allowed in Maths expressions: numbers, arithmetic, comparisons and calls
+MATHS_NODES = tuple(
+    node
+    for node in (
+        getattr(ast, name, None)
+        for name in (
+            "Expression", "Constant", "Num", "Name", "Load", "Call", "BinOp", "UnaryOp",
+            "Compare", "IfExp", "BoolOp", "Add", "Sub", "Mult", "Div", "FloorDiv", "Mod",
+            "Pow", "UAdd", "USub", "Not", "And", "Or", "Eq", "NotEq", "Lt", "LtE", "Gt", "GtE",
+        )
+    )
+    if node is not None
+)
+
+# Name of the Text Block created for the Command Journal
+JOURNAL_NAME = "PDT Journal"
+# Journal entries held back by journal_buffer, None when entries are written at once
+_journal_buffer = None
+
+
+class CommandFailure(Exception):
+    """Raised by Command Handlers, carries the Error Message for the user.
+
+    Raised without a message when the error has already been reported.
+    """
+
+
+class CommandContext:
+    """State shared by the Handlers of one Command.
+
+    The selection is read from the bmesh the first time a handler asks for it and
+    reused after that, so a command scans the mesh at most once per element type.
+    """
+
+    def __init__(self, context, bm=None):
+        self.context = context
+        self.scene = context.scene
+        self.pg = context.scene.pdt_pg
+        self.obj = context.view_layer.objects.active
+        self.obj_loc = self.obj.matrix_world.decompose()[0] if self.obj is not None else None
+        self.bm = bm
+        self.vector = None
+        self._verts = None
+        self._edges = None
+        self._faces = None
+
+    @property
+    def verts(self):
+        """Selected Vertices."""
+        if self._verts is None:
+            self._verts = [v for v in self.bm.verts if v.select]
+        return self._verts
+
+    @property
+    def edges(self):
+        """Selected Edges."""
+        if self._edges is None:
+            self._edges = [e for e in self.bm.edges if e.select]
+        return self._edges
+
+    @property
+    def faces(self):
+        """Selected Faces."""
+        if self._faces is None:
+            self._faces = [f for f in self.bm.faces if f.select]
+        return self._faces
+
+    def geometry(self):
+        """Selected Faces, Edges and Vertices as one list."""
+        return self.faces + self.edges + self.verts
+
 
 def pdt_help(self, context):
     """Display PDT Command Line help in a pop-up."""
@@ -88,6 +210,7 @@ def pdt_help(self, context):
     label(text="- Math Options:")
     label(text="x, y, z: Send result to X, Y and Z input fields in PDT Design")
     label(text="d, a, p: Send result to Distance, Angle or Percent input field in PDT Design")
+    label(text="x, y, z, distance, angle, percent: Current PDT Design values, e.g. mdsqrt(x**2+y**2)")
     label(text="")
     label(text="Note that commands are case-insensitive: ED = Ed = eD = ed")
     label(text="")
@@ -96,12 +219,1001 @@ def pdt_help(self, context):
     label(text="ed0.5,,0.6")
     label(text="'- Extrude Geometry Delta 0.5 in X, 0 in Y, 0.6 in Z")
     label(text="")
+    label(text="dd1,0,0*50")
+    label(text="'- Duplicate Geometry as 50 Copies, each 1 further in X (E: 50 Extrusions)")
+    label(text="")
     label(text="fe0.1,4,0.5")
     label(text="'- Fillet Edges")
     label(text="'- Radius: 0.1 (float) -- the radius (or offset) of the bevel/fillet")
     label(text="'- Segments: 4 (int) -- choosing an even amount of segments gives better geometry")
     label(text="'- Profile: 0.5 (float[0.0;1.0]) -- 0.5 (default) yields a circular, convex shape")
 
+
+def _value(text):
+    """Return a Command Value as a float, invalid or missing values count as 0."""
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+class _FloatPower(ast.NodeTransformer):
+    """Turn a ** b into math.pow(a, b), so huge powers overflow instead of hanging."""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.Pow):
+            return node
+        call = ast.Call(
+            func=ast.Name(id="pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[]
+        )
+        return ast.copy_location(call, node)
+
+
+@lru_cache(maxsize=256)
+def compile_maths(exp):
+    """Compile a Maths Expression once it is checked to be safe to evaluate.
+
+    Only numbers, arithmetic, comparisons, calls of the maths functions and the
+    names in MATHS_GLOBALS & MATHS_VARIABLES are allowed, so an expression cannot
+    reach attributes, builtins or anything else that would run arbitrary code.
+    Powers are evaluated on floats, and factorial, comb & perm refuse arguments
+    above MATHS_WHOLE_MAX, so an expression cannot hang Blender either.
+
+    Args:
+        exp: Maths expression, e.g. degrees(atan(y / x)).
+
+    Returns:
+        Code object, evaluated by maths.
+
+    Raises:
+        CommandFailure: If the expression is not valid, or uses anything not allowed.
+    """
+
+    try:
+        tree = ast.parse(exp, "<PDT Maths>", "eval")
+    except SyntaxError:
+        raise CommandFailure(PDT_ERR_BADMATHS)
+    for node in ast.walk(tree):
+        if not isinstance(node, MATHS_NODES):
+            raise CommandFailure(f"{PDT_ERR_MATHS_NAME} {type(node).__name__}")
+        if isinstance(node, ast.Name) and not (
+            node.id in MATHS_VARIABLES or node.id in MATHS_GLOBALS and node.id != "__builtins__"
+        ):
+            raise CommandFailure(f"{PDT_ERR_MATHS_NAME} {node.id}")
+        if isinstance(node, ast.Call) and (node.keywords or not isinstance(node.func, ast.Name)):
+            raise CommandFailure(PDT_ERR_BADMATHS)
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise CommandFailure(PDT_ERR_BADMATHS)
+    tree = ast.fix_missing_locations(_FloatPower().visit(tree))
+    return compile(tree, "<PDT Maths>", "eval")
+
+
+@lru_cache(maxsize=256)
+def parse_command(cmd):
+    """Compile a Command String.
+
+    Results are cached per string, so a repeated command is only validated and
+    parsed once.
+
+    Args:
+        cmd: Command string, see command_run.
+
+    Returns:
+        Command namedtuple.
+
+    Raises:
+        CommandFailure: If the string is not a valid command.
+    """
+
+    if len(cmd) < 3:
+        raise CommandFailure(PDT_ERR_CHARS_NUM)
+    oper = cmd[0].upper()
+    if oper not in OPERATIONS:
+        raise CommandFailure(PDT_ERR_BADFLETTER)
+    mode = cmd[1].lower()
+    if mode not in {"a", "d", "e", "g", "i", "p", "v", "x", "y", "z"}:
+        raise CommandFailure(PDT_ERR_BADSLETTER)
+
+    if oper == "M":
+        if (oper, mode) not in COMMANDS:
+            raise CommandFailure(f"{mode} {PDT_ERR_NON_VALID} Maths)")
+        exp = cmd[2:]
+        if "," in exp:
+            raise CommandFailure(PDT_ERR_NOCOMMAS)
+        return Command(oper, mode, (), compile_maths(exp.strip()))
+
+    # "x"/"y"/"z" modes are only legal for Math Operation
+    if mode in {"x", "y", "z"}:
+        raise CommandFailure(PDT_ERR_BADCOORDL)
+    if (oper, mode) not in COMMANDS:
+        raise CommandFailure(f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'")
+    values, _, count = cmd[2:].partition("*")
+    if count:
+        if oper not in {"D", "E"}:
+            raise CommandFailure(PDT_ERR_ARRAY_OPER)
+        try:
+            count = int(count)
+        except ValueError:
+            count = 0
+        if count < 1:
+            raise CommandFailure(PDT_ERR_ARRAY_COUNT)
+    vals = tuple(_value(r) for r in values.split(","))
+    return Command(oper, mode, vals, None, count or 1)
+
+
+def check_object(cc, oper):
+    """Check the Active Object & Selection suit the Operation.
+
+    Args:
+        cc: CommandContext, its bm is set for Objects in Edit mode
+        oper: Operation letter.
+
+    Returns:
+        Nothing.
+
+    Raises:
+        CommandFailure: If the Object or its Selection is not valid.
+    """
+
+    obj = cc.obj
+    if obj is None:
+        raise CommandFailure(PDT_ERR_NO_ACT_OBJ)
+    if obj.mode == "EDIT":
+        if cc.bm is None:
+            cc.bm = bmesh.from_edit_mesh(obj.data)
+        bm = cc.bm
+        if oper == "S":
+            if len(bm.edges) < 1:
+                raise CommandFailure(f"{PDT_ERR_SEL_1_EDGEM} {len(bm.edges)})")
+        elif len(bm.select_history) >= 1:
+            if oper not in {"D", "E", "G", "N"}:
+                actV = checkSelection(1, bm, obj)
+            else:
+                actV = cc.verts[0] if cc.verts else None
+            if actV is None:
+                raise CommandFailure(PDT_ERR_VERT_MODE)
+    elif obj.mode != "OBJECT":
+        raise CommandFailure(f"{PDT_ERR_EDOB_MODE} {obj.mode})")
+    if oper in EDIT_ONLY and obj.mode != "EDIT":
+        raise CommandFailure(EDIT_ONLY[oper])
+
+
+def command_vector(cc, command):
+    """Return the Vector given by a Command's Values.
+
+    Args:
+        cc: CommandContext, its vector is set to the result
+        command: Command with mode a, d (3 values), i (2 values) or p (1 value).
+
+    Returns:
+        Vector, absolute for a & p modes, an offset for d & i modes.
+
+    Raises:
+        CommandFailure: If the number of values is wrong.
+    """
+
+    vals = command.vals
+    if command.mode in {"a", "d"}:
+        if len(vals) != 3:
+            raise CommandFailure(PDT_ERR_BAD3VALS)
+        cc.vector = Vector(vals)
+    elif command.mode == "i":
+        if len(vals) != 2:
+            raise CommandFailure(PDT_ERR_BAD2VALS)
+        cc.vector = disAng(vals, cc.pg.flip_angle, cc.pg.plane, cc.scene)
+    else:
+        if len(vals) != 1:
+            raise CommandFailure(PDT_ERR_BAD1VALS)
+        cc.vector = getPercent(cc.obj, cc.pg.flip_percent, vals[0], command.oper, cc.scene)
+        if cc.vector is None:
+            # getPercent has reported the error
+            raise CommandFailure()
+    return cc.vector
+
+
+def _place(cc, command, location):
+    """Put the Cursor, or the Pivot Point, at location."""
+    if command.oper == "C":
+        cc.scene.cursor.location = location
+    else:
+        cc.pg.pivot_loc = location
+
+
+def place_absolute(cc, command):
+    """Cursor or Pivot Point to Absolute/Global Coordinates."""
+    _place(cc, command, command_vector(cc, command))
+
+
+def place_relative(cc, command):
+    """Cursor or Pivot Point by Delta or Direction from its Reference."""
+    vector_delta = command_vector(cc, command)
+    if cc.pg.select == "REL":
+        current = cc.scene.cursor.location if command.oper == "C" else cc.pg.pivot_loc
+        _place(cc, command, current + vector_delta)
+    elif cc.pg.select == "SEL":
+        if cc.obj.mode == "EDIT":
+            _place(cc, command, cc.bm.select_history[-1].co + cc.obj_loc + vector_delta)
+        elif cc.obj.mode == "OBJECT":
+            _place(cc, command, cc.obj_loc + vector_delta)
+
+
+def place_percent(cc, command):
+    """Cursor or Pivot Point at Percent between Selected Points."""
+    vector_delta = command_vector(cc, command)
+    if cc.obj.mode == "EDIT":
+        _place(cc, command, cc.obj_loc + vector_delta)
+    elif cc.obj.mode == "OBJECT":
+        _place(cc, command, vector_delta)
+
+
+def move_absolute(cc, command):
+    """Move Selected Vertices or Objects to Absolute/Global Coordinates."""
+    vector_delta = command_vector(cc, command)
+    if cc.obj.mode == "EDIT":
+        verts = cc.verts
+        if len(verts) == 0:
+            raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+        for v in verts:
+            v.co = vector_delta - cc.obj_loc
+        merge_verts(cc.bm, verts)
+        cc.bm.select_history.clear()
+    elif cc.obj.mode == "OBJECT":
+        for ob in cc.context.view_layer.objects.selected:
+            ob.location = vector_delta
+
+
+def move_relative(cc, command):
+    """Move Selected Vertices or Objects by Delta or Direction."""
+    vector_delta = command_vector(cc, command)
+    if cc.obj.mode == "EDIT":
+        verts = cc.verts
+        if len(verts) == 0:
+            raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+        bmesh.ops.translate(cc.bm, verts=verts, vec=vector_delta)
+        cc.bm.select_history.clear()
+    elif cc.obj.mode == "OBJECT":
+        for ob in cc.context.view_layer.objects.selected:
+            # Delta is measured from the Active Object, Direction from each Object
+            origin = cc.obj_loc if command.mode == "d" else ob.location
+            ob.location = origin + vector_delta
+
+
+def move_percent(cc, command):
+    """Move Active Object to Percent between 2 Selected Objects."""
+    if cc.obj.mode == "OBJECT":
+        cc.obj.location = command_vector(cc, command)
+
+
+def new_vertex(cc, command):
+    """Add a New Vertex, the only one selected afterwards."""
+    vector_delta = command_vector(cc, command)
+    if command.mode == "a":
+        vNew = vector_delta - cc.obj_loc
+    elif command.mode == "p":
+        vNew = vector_delta
+    else:
+        vNew = cc.bm.select_history[-1].co + vector_delta
+    nVert = cc.bm.verts.new(vNew)
+    for v in cc.verts:
+        v.select_set(False)
+    nVert.select_set(True)
+    cc.bm.select_history.clear()
+
+
+def _split_selected(cc, command):
+    """Subdivide the Selected Edges once, returning the new Vertices."""
+    if command.mode != "a":
+        if len(cc.faces) != 0:
+            raise CommandFailure(PDT_ERR_FACE_SEL)
+        if len(cc.edges) < 1:
+            raise CommandFailure(f"{PDT_ERR_SEL_1_EDGEM} {len(cc.edges)})")
+    elif len(cc.edges) != 1:
+        raise CommandFailure(f"{PDT_ERR_SEL_1_EDGE} {len(cc.edges)})")
+    geom = bmesh.ops.subdivide_edges(cc.bm, edges=cc.edges, cuts=1)
+    return [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
+
+
+def split_edges_at(cc, command):
+    """Split the Selected Edge at a Point, Absolute or Percent."""
+    vector_delta = command_vector(cc, command)
+    new_verts = _split_selected(cc, command)
+    nVert = new_verts[0]
+    nVert.co = vector_delta - cc.obj_loc if command.mode == "a" else vector_delta
+    for v in cc.verts:
+        v.select_set(False)
+    nVert.select_set(True)
+    cc.bm.select_history.clear()
+
+
+def split_edges_by(cc, command):
+    """Split the Selected Edges at their Middle and move the Cuts by Delta or Direction."""
+    vector_delta = command_vector(cc, command)
+    new_verts = _split_selected(cc, command)
+    bmesh.ops.translate(cc.bm, verts=new_verts, vec=vector_delta)
+    for v in cc.verts + new_verts:
+        v.select_set(False)
+    cc.bm.select_history.clear()
+
+
+def extrude_vertices_absolute(cc, command):
+    """Extrude Selected Vertices to one New Vertex at Absolute/Global Coordinates."""
+    vector_delta = command_vector(cc, command)
+    verts = cc.verts
+    nVert = cc.bm.verts.new(vector_delta - cc.obj_loc)
+    for v in verts:
+        cc.bm.edges.new([v, nVert])
+        v.select_set(False)
+    nVert.select_set(True)
+    merge_verts(cc.bm, [nVert] + verts)
+    cc.bm.select_history.clear()
+
+
+def extrude_vertices_relative(cc, command):
+    """Extrude each Selected Vertex by Delta or Direction."""
+    vector_delta = command_vector(cc, command)
+    if len(cc.verts) == 0:
+        raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+    for v in cc.verts:
+        nVert = cc.bm.verts.new(v.co + vector_delta)
+        cc.bm.edges.new([v, nVert])
+        v.select_set(False)
+        nVert.select_set(True)
+    cc.bm.select_history.clear()
+
+
+def extrude_vertices_percent(cc, command):
+    """Extrude Vertices to a New Vertex at Percent between 2 Selected Vertices."""
+    vector_delta = command_vector(cc, command)
+    if len(cc.verts) == 0:
+        raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+    nVert = cc.bm.verts.new(vector_delta)
+    if cc.pg.extend:
+        for v in cc.verts:
+            cc.bm.edges.new([v, nVert])
+            v.select_set(False)
+    else:
+        cc.bm.edges.new([cc.bm.select_history[-1], nVert])
+    nVert.select_set(True)
+    cc.bm.select_history.clear()
+
+
+def _move_new_geometry(bm, bmesh_op, geom, vector_delta):
+    """Extrude or Duplicate geom and move the Result, returning the New Geometry."""
+    geom_new = bmesh_op(bm, geom=geom, use_select_history=True)["geom"]
+    verts_new = [v for v in geom_new if isinstance(v, bmesh.types.BMVert)]
+    bmesh.ops.translate(bm, verts=verts_new, vec=vector_delta)
+    return geom_new
+
+
+def _select_new_geometry(bm, geom_new):
+    """Select only the New Geometry."""
+    verts_new = [v for v in geom_new if isinstance(v, bmesh.types.BMVert)]
+    edges_new = [e for e in geom_new if isinstance(e, bmesh.types.BMEdge)]
+    faces_new = [f for f in geom_new if isinstance(f, bmesh.types.BMFace)]
+    updateSel(bm, verts_new, edges_new, faces_new)
+    bm.select_history.clear()
+
+
+def extrude_geometry(cc, command):
+    """Extrude Selected Geometry by Delta or Direction, count times over."""
+    vector_delta = command_vector(cc, command)
+    if len(cc.verts) == 0:
+        raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+    geom = cc.geometry()
+    for _ in range(command.count):
+        geom = _move_new_geometry(cc.bm, bmesh.ops.extrude_face_region, geom, vector_delta)
+    _select_new_geometry(cc.bm, geom)
+
+
+def duplicate_geometry(cc, command):
+    """Duplicate Selected Geometry by Delta or Direction, as a Linear Array of count Copies.
+
+    The copies before the last are made by duplicating the largest run of geometry
+    made so far that still fits, source included, so an array takes a number of
+    duplications that grows with the log of count. The last copy is selected.
+    """
+    vector_delta = command_vector(cc, command)
+    if len(cc.verts) == 0:
+        raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+    source = cc.geometry()
+    # Runs of consecutive copies, as (copies, geometry), all starting at the source
+    runs = [(1, source)]
+    made = 0
+    while made < command.count - 1:
+        size, geom = max(run for run in runs if run[0] < command.count - made)
+        geom_new = _move_new_geometry(
+            cc.bm, bmesh.ops.duplicate, geom, vector_delta * (made + 1)
+        )
+        made += size
+        runs.append((made + 1, runs[-1][1] + geom_new))
+    geom_new = _move_new_geometry(
+        cc.bm, bmesh.ops.duplicate, source, vector_delta * command.count
+    )
+    _select_new_geometry(cc.bm, geom_new)
+
+
+def fillet(cc, command):
+    """Fillet Selected Vertices or Edges."""
+    vals = command.vals
+    if len(vals) != 3:
+        raise CommandFailure(PDT_ERR_BAD3VALS)
+    if len(cc.verts) == 0:
+        raise CommandFailure(PDT_ERR_SEL_1_VERT)
+    # Note that passing an empty parameter results in that parameter being seen as "0"
+    # _offset <= 0 is ignored since a bevel/fillet radius must be > 0 to make sense
+    _offset = vals[0]
+    _segments = int(vals[1])
+    if _segments < 1:
+        _segments = 1   # This is a single, flat segment (ignores profile)
+    _profile = vals[2]
+    if _profile < 0.0 or _profile > 1.0:
+        _profile = 0.5  # This is a circular profile
+    bpy.ops.mesh.bevel(
+        offset_type="OFFSET",
+        offset=_offset,
+        segments=_segments,
+        profile=_profile,
+        vertex_only=command.mode == "v"
+    )
+
+
+def maths(cc, command):
+    """Evaluate a Maths Expression into a PDT Input Field."""
+    pg = cc.pg
+    coords = pg.cartesian_coords
+    variables = {
+        "x": coords.x,
+        "y": coords.y,
+        "z": coords.z,
+        "distance": pg.distance,
+        "angle": pg.angle,
+        "percent": pg.percent,
+    }
+    try:
+        num = float(eval(command.expression, MATHS_GLOBALS, variables))
+    except (ArithmeticError, TypeError, ValueError):
+        raise CommandFailure(PDT_ERR_BADMATHS)
+    if command.mode == "x":
+        pg.cartesian_coords.x = num
+    elif command.mode == "y":
+        pg.cartesian_coords.y = num
+    elif command.mode == "z":
+        pg.cartesian_coords.z = num
+    elif command.mode == "d":
+        pg.distance = num
+    elif command.mode == "a":
+        pg.angle = num
+    elif command.mode == "p":
+        pg.percent = num
+
+
+# Operation letters, and the message shown when they are used outside Edit mode
+OPERATIONS = {"C", "D", "E", "F", "G", "N", "M", "P", "V", "S"}
+EDIT_ONLY = {
+    "D": PDT_ERR_DUPEDIT,
+    "E": PDT_ERR_EXTEDIT,
+    "F": PDT_ERR_FILEDIT,
+    "N": PDT_ERR_ADDVEDIT,
+    "S": PDT_ERR_SPLITEDIT,
+    "V": PDT_ERR_EXTEDIT,
+}
+# Operations that change the mesh in Edit mode
+MESH_OPERATIONS = {"D", "E", "G", "N", "S", "V"}
+
+# Handler for every valid (operation, mode) pair
+COMMANDS = {
+    ("C", "a"): place_absolute,
+    ("C", "d"): place_relative,
+    ("C", "i"): place_relative,
+    ("C", "p"): place_percent,
+    ("P", "a"): place_absolute,
+    ("P", "d"): place_relative,
+    ("P", "i"): place_relative,
+    ("P", "p"): place_percent,
+    ("G", "a"): move_absolute,
+    ("G", "d"): move_relative,
+    ("G", "i"): move_relative,
+    ("G", "p"): move_percent,
+    ("N", "a"): new_vertex,
+    ("N", "d"): new_vertex,
+    ("N", "i"): new_vertex,
+    ("N", "p"): new_vertex,
+    ("S", "a"): split_edges_at,
+    ("S", "d"): split_edges_by,
+    ("S", "i"): split_edges_by,
+    ("S", "p"): split_edges_at,
+    ("V", "a"): extrude_vertices_absolute,
+    ("V", "d"): extrude_vertices_relative,
+    ("V", "i"): extrude_vertices_relative,
+    ("V", "p"): extrude_vertices_percent,
+    ("E", "d"): extrude_geometry,
+    ("E", "i"): extrude_geometry,
+    ("D", "d"): duplicate_geometry,
+    ("D", "i"): duplicate_geometry,
+    ("F", "v"): fillet,
+    ("F", "e"): fillet,
+    ("M", "x"): maths,
+    ("M", "y"): maths,
+    ("M", "z"): maths,
+    ("M", "d"): maths,
+    ("M", "a"): maths,
+    ("M", "p"): maths,
+}
+
+
+def new_vertices(cc, commands):
+    """Add a New Vertex at each of a run of Absolute Coordinates, the last one is selected."""
+    for v in cc.verts:
+        v.select_set(False)
+    for command in commands:
+        nVert = cc.bm.verts.new(Vector(command.vals) - cc.obj_loc)
+    nVert.select_set(True)
+    cc.bm.select_history.clear()
+
+
+def extrude_vertices_chain(cc, commands):
+    """Extrude each Selected Vertex through a run of Deltas, the chain ends are selected."""
+    verts = cc.verts
+    if len(verts) == 0:
+        raise CommandFailure(PDT_ERR_NO_SEL_GEOM)
+    offsets = np.cumsum([command.vals for command in commands], axis=0)
+    for v in verts:
+        start = v.co.copy()
+        prev = v
+        for offset in offsets:
+            nVert = cc.bm.verts.new(start + Vector(offset))
+            cc.bm.edges.new([prev, nVert])
+            prev = nVert
+        v.select_set(False)
+        prev.select_set(True)
+    cc.bm.select_history.clear()
+
+
+# Handlers for runs of consecutive journal entries with the same (operation, mode)
+BATCHES = {
+    ("N", "a"): new_vertices,
+    ("V", "d"): extrude_vertices_chain,
+}
+# Operations whose Direction mode may be journalled as the Delta it resolved to,
+# G only in Edit mode as it measures Direction from each Object in Object mode
+RESOLVE_DIRECTION = {"C", "D", "E", "N", "P", "S", "V"}
+# PDT settings written to a Journal Entry that cannot be resolved to plain values
+JOURNAL_FLAGS = ("flip_angle", "flip_percent", "extend")
+# PDT input field set by each Maths mode
+MATHS_FIELDS = {"d": "distance", "a": "angle", "p": "percent"}
+
+
+def journal_entry(cc, command):
+    """Return the Journal Line for a Command that has run.
+
+    A line holds the working plane, the move mode and the command with its values
+    resolved: Maths entries hold their result, Direction entries the Delta they
+    gave and Cursor, Pivot & New Vertex Percent entries the Absolute location.
+    Entries with no such equivalent, Direction moves of Objects and the other
+    Percent entries, are followed by the PDT settings they depend on as key=value
+    fields, with the View Matrix for the View (LO) plane, see journal_settings.
+
+    Args:
+        cc: CommandContext the command ran with
+        command: Command.
+
+    Returns:
+        Journal line as a string.
+    """
+
+    pg = cc.pg
+    oper, mode, vals, _, count = command
+    flags = ()
+    if oper == "M":
+        if mode in {"x", "y", "z"}:
+            vals = (getattr(pg.cartesian_coords, mode),)
+        else:
+            vals = (getattr(pg, MATHS_FIELDS[mode]),)
+    elif mode == "i":
+        if oper in RESOLVE_DIRECTION or cc.obj.mode == "EDIT":
+            mode = "d"
+            vals = tuple(cc.vector)
+        else:
+            flags = ("flip_angle",)
+    elif mode == "p":
+        if oper in {"C", "P"}:
+            mode = "a"
+            vals = tuple(cc.scene.cursor.location if oper == "C" else pg.pivot_loc)
+        elif oper == "N":
+            mode = "a"
+            vals = tuple(cc.vector + cc.obj_loc)
+        else:
+            flags = ("flip_percent", "extend") if oper == "V" else ("flip_percent",)
+    values = ",".join(repr(float(v)) for v in vals)
+    if count > 1:
+        values = f"{values}*{count}"
+    fields = [f"{pg.plane} {pg.select} {oper}{mode}{values}"]
+    fields += [f"{flag}={int(getattr(pg, flag))}" for flag in flags]
+    matrix = view_matrix()
+    if mode == "i" and pg.plane == "LO" and matrix is not None:
+        fields.append("view=" + ",".join(repr(float(v)) for row in matrix for v in row))
+    return " ".join(fields)
+
+
+def journal_settings(fields):
+    """Read the key=value Fields following a Journal Entry's Command.
+
+    Args:
+        fields: list of strings, as written by journal_entry.
+
+    Returns:
+        Dictionary of PDT setting and value, and View Matrix or None.
+
+    Raises:
+        ValueError: If a field is not valid.
+    """
+
+    flags = {}
+    view = None
+    for field in fields:
+        key, value = field.split("=", 1)
+        if key in JOURNAL_FLAGS:
+            flags[key] = bool(int(value))
+        elif key == "view":
+            numbers = [float(v) for v in value.split(",")]
+            if len(numbers) != 16:
+                raise ValueError(field)
+            view = Matrix([numbers[i : i + 4] for i in range(0, 16, 4)])
+        else:
+            raise ValueError(field)
+    return flags, view
+
+
+@contextmanager
+def journal_settings_applied(pg, flags, view):
+    """Apply a Journal Entry's Settings while it runs, then put the old ones back."""
+    saved = {key: getattr(pg, key) for key in flags}
+    for key, value in flags.items():
+        setattr(pg, key, value)
+    if view is not None:
+        previous_view = set_view_matrix(view)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            setattr(pg, key, value)
+        if view is not None:
+            set_view_matrix(previous_view)
+
+
+def record_command(cc, command):
+    """Append a Command to the Journal, or to the journal_buffer in use.
+
+    Args:
+        cc: CommandContext the command ran with
+        command: Command.
+
+    Returns:
+        Nothing.
+
+    Raises:
+        CommandFailure: If the journal file cannot be written.
+    """
+
+    entry = journal_entry(cc, command)
+    if _journal_buffer is not None:
+        _journal_buffer.append(entry)
+    else:
+        write_journal(cc.pg, [entry])
+
+
+def write_journal(pg, entries):
+    """Append Entries to the Journal File, or else the Journal Text Block.
+
+    The text block is created if the scene has none.
+
+    Args:
+        pg: PDT Scene Properties
+        entries: list of journal lines.
+
+    Returns:
+        Nothing.
+
+    Raises:
+        CommandFailure: If the journal file cannot be written.
+    """
+
+    lines = "".join(entry + "\n" for entry in entries)
+    if pg.journal_file:
+        try:
+            with open(bpy.path.abspath(pg.journal_file), "a") as journal:
+                journal.write(lines)
+        except OSError as err:
+            raise CommandFailure(f"{PDT_ERR_JOURNAL} {err}")
+        return
+    text = pg.journal_text
+    if text is None:
+        text = bpy.data.texts.new(JOURNAL_NAME)
+        pg.journal_text = text
+    text.cursor_set(len(text.lines) - 1, character=len(text.lines[-1].body))
+    text.write(lines)
+
+
+@contextmanager
+def journal_buffer(entries):
+    """Collect the Entries recorded inside the Block in entries, not the Journal.
+
+    A job records its commands this way, then writes them with write_journal once it
+    has finished, so the entries of a cancelled job are never written.
+    """
+    global _journal_buffer
+    _journal_buffer = entries
+    try:
+        yield entries
+    finally:
+        _journal_buffer = None
+
+
+def run_command(context, command, bm=None, update=True, journal=True):
+    """Run a Parsed Command.
+
+    Args:
+        context: Blender bpy.context instance
+        command: Command from parse_command
+        bm: optional bmesh of the Object in Edit mode, to share it between commands
+        update: call bmesh.update_edit_mesh when the mesh was changed
+        journal: record the command if pg.journal_record is set.
+
+    Returns:
+        Nothing.
+
+    Raises:
+        CommandFailure: If the command cannot be applied to the current selection.
+    """
+
+    cc = CommandContext(context, bm)
+    if command.oper != "M":
+        check_object(cc, command.oper)
+    debug(f"command: {command}, obj: {cc.obj}, bm: {cc.bm}, obj_loc: {cc.obj_loc}")
+    COMMANDS[command.oper, command.mode](cc, command)
+    if update and cc.bm is not None and command.oper in MESH_OPERATIONS:
+        bmesh.update_edit_mesh(cc.obj.data)
+    if journal and cc.pg.journal_record:
+        record_command(cc, command)
+
+
+def run_script(context, lines):
+    """Run Command Lines against one BMesh Session.
+
+    Runs script_steps to the end, see there for the arguments.
+    """
+
+    return run_job(script_steps(context, lines))
+
+
+def script_steps(context, lines):
+    """Run Command Lines against one BMesh Session, as a job generator.
+
+    Blank lines and lines starting with # are skipped. A failing line is recorded
+    and the remaining lines still run. The mesh is updated once at the end.
+
+    Args:
+        context: Blender bpy.context instance
+        lines: list of command strings.
+
+    Yields:
+        Progress, from 0.0 to 1.0, after each line.
+
+    Returns:
+        Number of commands run, and list of (line number, command, message) tuples
+        for the commands that failed.
+    """
+
+    pg = context.scene.pdt_pg
+    obj = context.view_layer.objects.active
+    bm = None
+    if obj is not None and obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+    count = 0
+    errors = []
+    for number, line in enumerate(lines, 1):
+        cmd = line.strip()
+        if not cmd or cmd.startswith("#"):
+            continue
+        count += 1
+        try:
+            run_command(context, parse_command(cmd), bm, update=False)
+        except CommandFailure as err:
+            errors.append((number, cmd, err.args[0] if err.args else pg.error))
+        except Exception as err:
+            # One bad line must not lose the work done by the others
+            errors.append((number, cmd, f"{type(err).__name__}: {err}"))
+        yield number / len(lines)
+    if bm is not None:
+        bmesh.update_edit_mesh(obj.data)
+    return count, errors
+
+
+def _batch_key(entry):
+    """Group consecutive batchable Journal Entries, every other entry is on its own."""
+    number, command = entry[0], entry[3]
+    key = (command.oper, command.mode)
+    if key in BATCHES and len(command.vals) == 3:
+        return key
+    return number
+
+
+def replay_journal(context, lines):
+    """Replay Journal Lines against one BMesh Session.
+
+    Runs journal_steps to the end, see there for the arguments.
+    """
+
+    return run_job(journal_steps(context, lines))
+
+
+def journal_steps(context, lines):
+    """Replay Journal Lines against one BMesh Session, as a job generator.
+
+    Runs of consecutive new vertex (NA) or vertex extrusion (VD) entries are applied
+    as one operation. A failing entry, or run, is recorded and replay carries on.
+    Nothing is added to the journal while it is replayed.
+
+    Args:
+        context: Blender bpy.context instance
+        lines: list of journal lines, as written by record_command.
+
+    Yields:
+        Progress, from 0.0 to 1.0, after each entry or run of entries.
+
+    Returns:
+        Number of entries, and list of (line number, entry, message) tuples for the
+        entries that failed.
+    """
+
+    pg = context.scene.pdt_pg
+    obj = context.view_layer.objects.active
+    bm = None
+    if obj is not None and obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+    count = 0
+    errors = []
+    entries = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        count += 1
+        try:
+            plane, select, cmd, *fields = line.split()
+            flags, view = journal_settings(fields)
+            entries.append((number, plane, select, parse_command(cmd), line, flags, view))
+        except ValueError:
+            errors.append((number, line, PDT_ERR_JOURNAL_LINE))
+        except CommandFailure as err:
+            errors.append((number, line, err.args[0]))
+
+    for key, group in groupby(entries, _batch_key):
+        group = list(group)
+        number, plane, select, command, line, flags, view = group[-1]
+        try:
+            pg.plane = plane
+            pg.select = select
+            if len(group) == 1:
+                with journal_settings_applied(pg, flags, view):
+                    run_command(context, command, bm, update=False, journal=False)
+            else:
+                cc = CommandContext(context, bm)
+                check_object(cc, command.oper)
+                BATCHES[key](cc, [entry[3] for entry in group])
+        except CommandFailure as err:
+            errors.append((group[0][0], group[0][4], err.args[0] if err.args else pg.error))
+        except Exception as err:
+            # One bad entry must not lose the work done by the others
+            errors.append((group[0][0], group[0][4], f"{type(err).__name__}: {err}"))
+        yield number / len(lines)
+    errors.sort()
+    if bm is not None:
+        bmesh.update_edit_mesh(obj.data)
+    return count, errors
+
+
+def script_lines(text, filepath):
+    """Return the Lines of a Text Block, or else of a File.
+
+    Args:
+        text: Text block or None
+        filepath: File path, may be relative to the blend file.
+
+    Returns:
+        List of lines, or None if neither a text block nor a file is given.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+
+    if text is not None:
+        return text.as_string().splitlines()
+    if filepath:
+        with open(bpy.path.abspath(filepath)) as script:
+            return script.read().splitlines()
+    return None
+
+
+class PDT_OT_CommandScript(JobOperator, bpy.types.Operator):
+    """Run PDT Commands from a Text Block or File as one Undo Step, Esc to Cancel."""
+
+    bl_idname = "pdt.command_script"
+    bl_label = "Run Command Script"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def job(self, context):
+        """Run every Line of the Command Script.
+
+        Failing lines are reported as warnings, the other lines are still run.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Yields:
+            Progress, from 0.0 to 1.0.
+        """
+
+        pg = context.scene.pdt_pg
+        try:
+            lines = script_lines(pg.command_text, pg.command_file)
+        except OSError as err:
+            self.report({"ERROR"}, f"{PDT_ERR_SCRIPT_READ} {err}")
+            return
+        if lines is None:
+            self.report({"ERROR"}, PDT_ERR_NO_SCRIPT)
+            return
+
+        with journal_buffer([]) as entries:
+            count, errors = yield from script_steps(context, lines)
+        for number, cmd, message in errors:
+            self.report({"WARNING"}, f"{PDT_LAB_SCRIPTLINE} {number} ({cmd}): {message}")
+        self.report({"INFO"}, f"{PDT_INF_SCRIPT} {count - len(errors)}/{count}")
+        if entries:
+            try:
+                write_journal(pg, entries)
+            except CommandFailure as err:
+                self.report({"ERROR"}, err.args[0])
+
+
+class PDT_OT_JournalReplay(JobOperator, bpy.types.Operator):
+    """Replay the PDT Command Journal as one Undo Step, Esc to Cancel."""
+
+    bl_idname = "pdt.journal_replay"
+    bl_label = "Replay Journal"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def job(self, context):
+        """Replay every Entry of the Journal File, or else Text Block.
+
+        Failing entries are reported as warnings, the other entries are still run.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Yields:
+            Progress, from 0.0 to 1.0.
+        """
+
+        pg = context.scene.pdt_pg
+        try:
+            # Same rule as record_command, the file wins over the text block when set
+            text = None if pg.journal_file else pg.journal_text
+            lines = script_lines(text, pg.journal_file)
+        except OSError as err:
+            self.report({"ERROR"}, f"{PDT_ERR_SCRIPT_READ} {err}")
+            return
+        if lines is None:
+            self.report({"ERROR"}, PDT_ERR_NO_JOURNAL)
+            return
+
+        count, errors = yield from journal_steps(context, lines)
+        for number, line, message in errors:
+            self.report({"WARNING"}, f"{PDT_LAB_SCRIPTLINE} {number} ({line}): {message}")
+        self.report({"INFO"}, f"{PDT_INF_SCRIPT} {count - len(errors)}/{count}")
+
+
 def command_run(self, context):
     """Run Command String as input into Command Line.
 
@@ -147,12 +1259,14 @@ def command_run(self, context):
 
             This is why all Math functions are imported
 
+        Commands are compiled once by parse_command and run by the handler
+        registered for their operation and mode in COMMANDS.
+
     Returns:
         Nothing.
     """
 
-    scene = context.scene
-    pg = scene.pdt_pg
+    pg = context.scene.pdt_pg
     cmd = pg.command
 
     if cmd.strip() == "?" or cmd.lower().strip() == "help":
@@ -160,721 +1274,8 @@ def command_run(self, context):
         context.window_manager.popup_menu(pdt_help, title="PDT Command Line Help", icon="INFO")
         # fmt: on
         return
-    if len(cmd) < 3:
-        pg.error = PDT_ERR_CHARS_NUM
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
-    oper = cmd[0].upper()
-    if oper not in {"C", "D", "E", "F", "G", "N", "M", "P", "V", "S"}:
-        pg.error = PDT_ERR_BADFLETTER
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
-    mode = cmd[1].lower()
-    if mode not in {"a", "d", "e", "g", "i", "p", "v", "x", "y", "z"}:
-        pg.error = PDT_ERR_BADSLETTER
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
-
-    # --------------
-    # Math Operation
-    if oper == "M":
-        if mode not in {"x", "y", "z", "d", "a", "p"}:
-            pg.error = f"{mode} {PDT_ERR_NON_VALID} Maths)"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        exp = cmd[2:]
-        namespace = {}
-        namespace.update(vars(math))
-        if "," in exp:
-            pg.error = PDT_ERR_NOCOMMAS
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        try:
-            num = eval(exp, namespace, namespace)
-        except ValueError:
-            pg.error = PDT_ERR_BADMATHS
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if mode == "x":
-            pg.cartesian_coords.x = num
-        elif mode == "y":
-            pg.cartesian_coords.y = num
-        elif mode == "z":
-            pg.cartesian_coords.z = num
-        elif mode == "d":
-            pg.distance = num
-        elif mode == "a":
-            pg.angle = num
-        elif mode == "p":
-            pg.percent = num
-        return
-    # "x"/"y"/"z" modes are only legal for Math Operation
-    else:
-        if mode in {"x", "y", "z"}:
-            pg.error = PDT_ERR_BADCOORDL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-
-    # -----------------------------------------------------
-    # Not a Math Operation, so let's parse the command line
-    vals = cmd[2:].split(",")
-    ind = 0
-    for r in vals:
-        try:
-            _ = float(r)
-            good = True
-        except ValueError:
-            vals[ind] = "0"
-        ind = ind + 1
-    mode_s = pg.select
-    flip_a = pg.flip_angle
-    flip_p = pg.flip_percent
-    ext_a = pg.extend
-    plane = pg.plane
-    obj = context.view_layer.objects.active
-    #FIXME: What does call this imply in terms of invariants?
-    #       There's a lot of places in the code where we rely on bm not being None...
-    bm, good = objCheck(obj, scene, oper)
-    obj_loc = None
-    if good:
-        obj_loc = obj.matrix_world.decompose()[0]
-    debug(f"cmd: {cmd}")
-    debug(f"obj: {obj}, bm: {bm}, obj_loc: {obj_loc}")
-
-    # static set variable for use in recurring comparisons
-    adip = {"a", "d", "i", "p"}
-
-    # ---------------------
-    # Cursor or Pivot Point
-    if oper in {"C", "P"}:
-        if mode not in adip:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Absolute/Global Coordinates
-        if mode == "a":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            if oper == "C":
-                scene.cursor.location = vector_delta
-            else:
-                pg.pivot_loc = vector_delta
-        # Delta/Relative Coordinates
-        elif mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            if mode_s == "REL":
-                if oper == "C":
-                    scene.cursor.location = scene.cursor.location + vector_delta
-                else:
-                    pg.pivot_loc = pg.pivot_loc + vector_delta
-            elif mode_s == "SEL":
-                if obj.mode == "EDIT":
-                    if oper == "C":
-                        scene.cursor.location = (
-                            bm.select_history[-1].co + obj_loc + vector_delta
-                        )
-                    else:
-                        pg.pivot_loc = bm.select_history[-1].co + obj_loc + vector_delta
-                elif obj.mode == "OBJECT":
-                    if oper == "C":
-                        scene.cursor.location = obj_loc + vector_delta
-                    else:
-                        pg.pivot_loc = obj_loc + vector_delta
-        # Direction/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            if mode_s == "REL":
-                if oper == "C":
-                    scene.cursor.location = scene.cursor.location + vector_delta
-                else:
-                    pg.pivot_loc = pg.pivot_loc + vector_delta
-            elif mode_s == "SEL":
-                if obj.mode == "EDIT":
-                    if oper == "C":
-                        scene.cursor.location = (
-                            bm.select_history[-1].co + obj_loc + vector_delta
-                        )
-                    else:
-                        pg.pivot_loc = bm.select_history[-1].co + obj_loc + vector_delta
-                elif obj.mode == "OBJECT":
-                    if oper == "C":
-                        scene.cursor.location = obj_loc + vector_delta
-                    else:
-                        pg.pivot_loc = obj_loc + vector_delta
-        # Percent Options
-        elif mode == "p":
-            if len(vals) != 1:
-                pg.error = PDT_ERR_BAD1VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = getPercent(obj, flip_p, float(vals[0]), oper, scene)
-            if vector_delta is None:
-                return
-            if obj.mode == "EDIT":
-                if oper == "C":
-                    scene.cursor.location = obj_loc + vector_delta
-                else:
-                    pg.pivot_loc = obj_loc + vector_delta
-            elif obj.mode == "OBJECT":
-                if oper == "C":
-                    scene.cursor.location = vector_delta
-                else:
-                    pg.pivot_loc = vector_delta
-        return
-
-    # ------------------------
-    # Move Vertices or Objects
-    elif oper == "G":
-        if mode not in adip:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Absolute/Global Coordinates
-        if mode == "a":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            if obj.mode == "EDIT":
-                verts = [v for v in bm.verts if v.select]
-                if len(verts) == 0:
-                    pg.error = PDT_ERR_NO_SEL_GEOM
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                    return
-                for v in verts:
-                    v.co = vector_delta - obj_loc
-                bmesh.ops.remove_doubles(
-                    bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-                )
-                bmesh.update_edit_mesh(obj.data)
-                bm.select_history.clear()
-            elif obj.mode == "OBJECT":
-                for ob in context.view_layer.objects.selected:
-                    ob.location = vector_delta
-        # Delta/Relative Coordinates
-        elif mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            if obj.mode == "EDIT":
-                # FIXME: Show error popup if nothing is selected?
-                bmesh.ops.translate(
-                    bm, verts=[v for v in bm.verts if v.select], vec=vector_delta
-                )
-                bmesh.update_edit_mesh(obj.data)
-                bm.select_history.clear()
-            elif obj.mode == "OBJECT":
-                for ob in context.view_layer.objects.selected:
-                    ob.location = obj_loc + vector_delta
-        # Direction/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            if obj.mode == "EDIT":
-                verts = [v for v in bm.verts if v.select]
-                if len(verts) == 0:
-                    pg.error = PDT_ERR_NO_SEL_GEOM
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                    return
-                bmesh.ops.translate(bm, verts=verts, vec=vector_delta)
-                bmesh.update_edit_mesh(obj.data)
-                bm.select_history.clear()
-            elif obj.mode == "OBJECT":
-                for ob in context.view_layer.objects.selected:
-                    ob.location = ob.location + vector_delta
-        # Percent Options
-        elif mode == "p":
-            if obj.mode == "OBJECT":
-                if len(vals) != 1:
-                    pg.error = PDT_ERR_BAD1VALS
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                    return
-                vector_delta = getPercent(obj, flip_p, float(vals[0]), oper, scene)
-                if vector_delta is None:
-                    return
-                ob.location = vector_delta
-        return
-
-    # --------------
-    # Add New Vertex
-    elif oper == "N":
-        if mode not in adip:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_ADDVEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Absolute/Global Coordinates
-        if mode == "a":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            vNew = vector_delta - obj_loc
-            nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Delta/Relative Coordinates
-        elif mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            vNew = bm.select_history[-1].co + vector_delta
-            nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Direction/Polar Coordinates
-        elif mode == "d":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            vNew = bm.select_history[-1].co + vector_delta
-            nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Percent Options
-        elif mode == "p":
-            if len(vals) != 1:
-                pg.error = PDT_ERR_BAD1VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = getPercent(obj, flip_p, float(vals[0]), oper, scene)
-            vNew = vector_delta
-            nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        return
-
-    # -----------
-    # Split Edges
-    elif oper == "S":
-        if mode not in adip:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_SPLITEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Absolute/Global Coordinates
-        if mode == "a":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            edges = [e for e in bm.edges if e.select]
-            if len(edges) != 1:
-                pg.error = f"{PDT_ERR_SEL_1_EDGE} {len(edges)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
-            new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
-            nVert = new_verts[0]
-            nVert.co = vector_delta - obj_loc
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Delta/Relative Coordinates
-        elif mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            edges = [e for e in bm.edges if e.select]
-            faces = [f for f in bm.faces if f.select]
-            if len(faces) != 0:
-                pg.error = PDT_ERR_FACE_SEL
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            if len(edges) < 1:
-                pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
-            new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            for v in new_verts:
-                v.select_set(False)
-            bmesh.ops.translate(bm, verts=new_verts, vec=vector_delta)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            for v in new_verts:
-                v.select_set(False)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Directional/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            edges = [e for e in bm.edges if e.select]
-            faces = [f for f in bm.faces if f.select]
-            if len(faces) != 0:
-                pg.error = PDT_ERR_FACE_SEL
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            if len(edges) < 1:
-                pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
-            new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
-            bmesh.ops.translate(bm, verts=new_verts, vec=vector_delta)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            for v in new_verts:
-                v.select_set(False)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Percent Options
-        elif mode == "p":
-            if len(vals) != 1:
-                pg.error = PDT_ERR_BAD1VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = getPercent(obj, flip_p, float(vals[0]), oper, scene)
-            if vector_delta is None:
-                return
-            edges = [e for e in bm.edges if e.select]
-            faces = [f for f in bm.faces if f.select]
-            if len(faces) != 0:
-                pg.error = PDT_ERR_FACE_SEL
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            if len(edges) < 1:
-                pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
-            new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
-            nVert = new_verts[0]
-            nVert.co = vector_delta
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        return
-
-    # ----------------
-    # Extrude Vertices
-    elif oper == "V":
-        if mode not in adip:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_EXTEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Absolute/Global Coordinates
-        if mode == "a":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            vNew = vector_delta - obj_loc
-            nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
-                bm.edges.new([v, nVert])
-                v.select_set(False)
-            nVert.select_set(True)
-            bmesh.ops.remove_doubles(
-                bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-            )
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Delta/Relative Coordinates
-        elif mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            for v in verts:
-                nVert = bm.verts.new(v.co)
-                nVert.co = nVert.co + vector_delta
-                bm.edges.new([v, nVert])
-                v.select_set(False)
-                nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Direction/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            for v in verts:
-                nVert = bm.verts.new(v.co)
-                nVert.co = nVert.co + vector_delta
-                bm.edges.new([v, nVert])
-                v.select_set(False)
-                nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Percent Options
-        elif mode == "p":
-            vector_delta = getPercent(obj, flip_p, float(vals[0]), oper, scene)
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            nVert = bm.verts.new(vector_delta)
-            if ext_a:
-                for v in [v for v in bm.verts if v.select]:
-                    bm.edges.new([v, nVert])
-                    v.select_set(False)
-            else:
-                bm.edges.new([bm.select_history[-1], nVert])
-            nVert.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        return
-
-    # ----------------
-    # Extrude Geometry
-    elif oper == "E":
-        if mode not in {"d", "i"}:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_EXTEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Delta/Relative Coordinates
-        if mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            ret = bmesh.ops.extrude_face_region(
-                bm,
-                geom=(
-                    [f for f in bm.faces if f.select]
-                    + [e for e in bm.edges if e.select]
-                    + [v for v in bm.verts if v.select]
-                ),
-                use_select_history=True,
-            )
-            geom_extr = ret["geom"]
-            verts_extr = [v for v in geom_extr if isinstance(v, bmesh.types.BMVert)]
-            edges_extr = [e for e in geom_extr if isinstance(e, bmesh.types.BMEdge)]
-            faces_extr = [f for f in geom_extr if isinstance(f, bmesh.types.BMFace)]
-            del ret
-            bmesh.ops.translate(bm, verts=verts_extr, vec=vector_delta)
-            updateSel(bm, verts_extr, edges_extr, faces_extr)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Direction/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            ret = bmesh.ops.extrude_face_region(
-                bm,
-                geom=(
-                    [f for f in bm.faces if f.select]
-                    + [e for e in bm.edges if e.select]
-                    + [v for v in bm.verts if v.select]
-                ),
-                use_select_history=True,
-            )
-            geom_extr = ret["geom"]
-            verts_extr = [v for v in geom_extr if isinstance(v, bmesh.types.BMVert)]
-            edges_extr = [e for e in geom_extr if isinstance(e, bmesh.types.BMEdge)]
-            faces_extr = [f for f in geom_extr if isinstance(f, bmesh.types.BMFace)]
-            del ret
-            bmesh.ops.translate(bm, verts=verts_extr, vec=vector_delta)
-            updateSel(bm, verts_extr, edges_extr, faces_extr)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        return
-
-    # ------------------
-    # Duplicate Geometry
-    elif oper == "D":
-        if mode not in {"d", "i"}:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_DUPEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Delta/Relative Coordinates
-        if mode == "d":
-            if len(vals) != 3:
-                pg.error = PDT_ERR_BAD3VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = Vector((float(vals[0]), float(vals[1]), float(vals[2])))
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            ret = bmesh.ops.duplicate(
-                bm,
-                geom=(
-                    [f for f in bm.faces if f.select]
-                    + [e for e in bm.edges if e.select]
-                    + [v for v in bm.verts if v.select]
-                ),
-                use_select_history=True,
-            )
-            geom_dupe = ret["geom"]
-            verts_dupe = [v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)]
-            edges_dupe = [e for e in geom_dupe if isinstance(e, bmesh.types.BMEdge)]
-            faces_dupe = [f for f in geom_dupe if isinstance(f, bmesh.types.BMFace)]
-            del ret
-            bmesh.ops.translate(bm, verts=verts_dupe, vec=vector_delta)
-            updateSel(bm, verts_dupe, edges_dupe, faces_dupe)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        # Direction/Polar Coordinates
-        elif mode == "i":
-            if len(vals) != 2:
-                pg.error = PDT_ERR_BAD2VALS
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            vector_delta = disAng(vals, flip_a, plane, scene)
-            verts = [v for v in bm.verts if v.select]
-            if len(verts) == 0:
-                pg.error = PDT_ERR_NO_SEL_GEOM
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return
-            ret = bmesh.ops.duplicate(
-                bm,
-                geom=(
-                    [f for f in bm.faces if f.select]
-                    + [e for e in bm.edges if e.select]
-                    + [v for v in bm.verts if v.select]
-                ),
-                use_select_history=True,
-            )
-            geom_dupe = ret["geom"]
-            verts_dupe = [v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)]
-            edges_dupe = [e for e in geom_dupe if isinstance(e, bmesh.types.BMEdge)]
-            faces_dupe = [f for f in geom_dupe if isinstance(f, bmesh.types.BMFace)]
-            del ret
-            bmesh.ops.translate(bm, verts=verts_dupe, vec=vector_delta)
-            updateSel(bm, verts_dupe, edges_dupe, faces_dupe)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-        return
-
-    # ---------------
-    # Fillet Geometry
-    elif oper == "F":
-        if mode not in {"v", "e"}:
-            pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{oper}'"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if obj is None:
-            pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if not obj.mode == "EDIT":
-            pg.error = PDT_ERR_FILEDIT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if len(vals) != 3:
-            pg.error = PDT_ERR_BAD3VALS
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        if mode == "v":
-            vert_bool = True
-        elif mode == "e":
-            vert_bool = False
-        verts = [v for v in bm.verts if v.select]
-        if len(verts) == 0:
-            pg.error = PDT_ERR_SEL_1_VERT
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            return
-        # Note that passing an empty parameter results in that parameter being seen as "0"
-        # _offset <= 0 is ignored since a bevel/fillet radius must be > 0 to make sense
-        _offset = float(vals[0])
-        _segments = int(vals[1])
-        if _segments < 1:
-            _segments = 1   # This is a single, flat segment (ignores profile)
-        _profile = float(vals[2])
-        if _profile < 0.0 or _profile > 1.0:
-            _profile = 0.5  # This is a circular profile
-        bpy.ops.mesh.bevel(
-            offset_type="OFFSET",
-            offset=_offset,
-            segments=_segments,
-            profile=_profile,
-            vertex_only=vert_bool
-        )
-        return
+    try:
+        run_command(context, parse_command(cmd))
+    except CommandFailure as err:
+        if err.args:
+            report_error(pg, err.args[0])
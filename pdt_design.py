@@ -28,17 +28,17 @@ from bpy.types import Operator
 from mathutils import Vector
 from mathutils.geometry import intersect_point_line
 from math import sin, cos, tan, pi, sqrt
+from . import pdt_cad_module as cm
 from .pdt_functions import (
     setMode,
     checkSelection,
     setAxis,
     updateSel,
-    viewCoords,
-    viewCoordsI,
-    viewDir,
+    ViewTransform,
     arcCentre,
     intersection,
     getPercent,
+    merge_verts,
 )
 from .pdt_msg_strings import (
     PDT_ERR_CONNECTED,
@@ -63,8 +63,10 @@ from .pdt_msg_strings import (
     PDT_ERR_SEL_4_VERTS,
     PDT_ERR_STRIGHT_LINE,
     PDT_ERR_TAPER_ANG,
+    PDT_ERR_TAPER_AXIS,
     PDT_ERR_TAPER_SEL,
     PDT_ERR_VERT_MODE,
+    PDT_ERR_ZERO_SCALE,
     PDT_INF_OBJ_MOVED,
     PDT_LAB_ABS,
     PDT_LAB_ARCCENTRE,
@@ -136,7 +138,7 @@ class PDT_OT_PlacementAbs(Operator):
                 for v in verts:
                     v.co = vector_delta - obj_loc
                 bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
+                merge_verts(bm, verts)
                 bmesh.update_edit_mesh(obj.data)
             elif obj.mode == "OBJECT":
                 for ob in context.view_layer.objects.selected:
@@ -176,12 +178,13 @@ class PDT_OT_PlacementAbs(Operator):
         elif oper == "EV" and obj.mode == "EDIT":
             vNew = vector_delta - obj_loc
             nVert = bm.verts.new(vNew)
-            for v in [v for v in bm.verts if v.select]:
+            verts = [v for v in bm.verts if v.select]
+            for v in verts:
                 bm.edges.new([v, nVert])
                 v.select_set(False)
             nVert.select_set(True)
             bm.select_history.clear()
-            bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
+            merge_verts(bm, [nVert] + verts)
             bmesh.update_edit_mesh(obj.data)
         else:
             errmsg = f"{oper} {PDT_ERR_NON_VALID} {PDT_LAB_ABS}"
@@ -230,7 +233,7 @@ class PDT_OT_PlacementDelta(Operator):
         oper = pg.operation
 
         if pg.plane == "LO":
-            vector_delta = viewCoords(x_loc, y_loc, z_loc)
+            vector_delta = ViewTransform().to_world((x_loc, y_loc, z_loc))
         else:
             vector_delta = Vector((x_loc, y_loc, z_loc))
         if mode_s == "REL" and oper == "CU":
@@ -412,7 +415,7 @@ class PDT_OT_PlacementDis(Operator):
                 ang_v = ang_v + 180
             pg.angle = ang_v
         if plane == "LO":
-            vector_delta = viewDir(dis_v, ang_v)
+            vector_delta = ViewTransform().direction(dis_v, ang_v)
         else:
             a1, a2, _ = setMode(plane)
             vector_delta = Vector((0, 0, 0))
@@ -738,12 +741,11 @@ class PDT_OT_PlacementNormal(Operator):
         elif oper == "MV":
             if obj.mode == "EDIT":
                 if ext_a:
-                    for v in [v for v in bm.verts if v.select]:
+                    verts = [v for v in bm.verts if v.select]
+                    for v in verts:
                         v.co = vector_delta
                     bm.select_history.clear()
-                    bmesh.ops.remove_doubles(
-                        bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-                    )
+                    merge_verts(bm, verts)
                 else:
                     bm.select_history[-1].co = vector_delta
                     bm.select_history.clear()
@@ -906,7 +908,10 @@ class PDT_OT_PlacementInt(Operator):
                     elif oper == "EV" and ext_a:
                         bm.edges.new([vf, nVert])
                 bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+                # The intersection may also land on any other vertex of the mesh
+                merge_verts(
+                    bm, [nVert, va, vo, vl, vf] if nVert else [va, vo, vl, vf], neighbours=True
+                )
 
                 if not proc and not ext_a:
                     errmsg = PDT_ERR_INT_NO_ALL
@@ -1051,12 +1056,11 @@ class PDT_OT_PlacementCen(Operator):
             elif oper == "MV":
                 if obj.mode == "EDIT":
                     if ext_a:
-                        for v in [v for v in bm.verts if v.select]:
+                        verts = [v for v in bm.verts if v.select]
+                        for v in verts:
                             v.co = vector_delta
                         bm.select_history.clear()
-                        bmesh.ops.remove_doubles(
-                            bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-                        )
+                        merge_verts(bm, verts)
                     else:
                         bm.select_history[-1].co = vector_delta
                         bm.select_history.clear()
@@ -1066,14 +1070,13 @@ class PDT_OT_PlacementCen(Operator):
             elif oper == "EV":
                 nVert = bm.verts.new(vector_delta)
                 if ext_a:
-                    for v in [v for v in bm.verts if v.select]:
+                    verts = [v for v in bm.verts if v.select]
+                    for v in verts:
                         bm.edges.new([v, nVert])
                         v.select_set(False)
                     nVert.select_set(True)
                     bm.select_history.clear()
-                    bmesh.ops.remove_doubles(
-                        bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-                    )
+                    merge_verts(bm, [nVert] + verts)
                     bmesh.update_edit_mesh(obj.data)
                 else:
                     bm.edges.new([bm.select_history[-1], nVert])
@@ -1262,8 +1265,7 @@ class PDT_OT_Angle2(Operator):
             actV = obj.matrix_world.decompose()[0]
             othV = objs_s[-1].matrix_world.decompose()[0]
         if plane == "LO":
-            disV = othV - actV
-            othV = viewCoordsI(disV.x, disV.y, disV.z)
+            othV = ViewTransform().to_view(othV - actV)
             actV = Vector((0, 0, 0))
             v0 = np.array([actV.x + 1, actV.y]) - np.array([actV.x, actV.y])
             v1 = np.array([othV.x, othV.y]) - np.array([actV.x, actV.y])
@@ -1424,18 +1426,21 @@ class PDT_OT_Taper(Operator):
 
 
     def execute(self, context):
-        """Taper Geometry along World Axes.
+        """Taper Geometry along World Axes, or a Custom Axis.
 
         Similar to Shear command except that it shears by angle rather than displacement.
         Rotates about World Axes and displaces along World Axes, angle must not exceed +-80 degrees.
         Rotation axis is centred on Active Vertex.
+        With Custom Axes, rotates about pg.taper_axis through the Pivot Point and displaces
+        along pg.taper_move, both in World space.
+        All Selected Vertices are tapered as one array.
         Works only in Edit mode.
 
         Args:
             context: Blender bpy.context instance.
 
         Note:
-            Uses pg.taper & pg.angle scene variables
+            Uses pg.taper, pg.angle, pg.taper_axis, pg.taper_move & pg.pivot_loc scene variables
 
         Returns:
             Status Set.
@@ -1454,25 +1459,39 @@ class PDT_OT_Taper(Operator):
             errmsg = PDT_ERR_NO_ACT_OBJ
             self.report({"ERROR"}, errmsg)
             return {"FINISHED"}
-        _, a2, a3 = setAxis(tap_ax)
         bm = bmesh.from_edit_mesh(obj.data)
-        if len(bm.select_history) >= 1:
-            rotV = bm.select_history[-1]
-            viewV = viewCoords(rotV.co.x, rotV.co.y, rotV.co.z)
-        else:
+        snapshot = cm.GeometrySnapshot.from_bmesh(bm)
+        vert_indices = snapshot.selected_verts()
+        coords = snapshot.vert_coords(vert_indices)
+        tan_v = -tan(ang_v * pi / 180)
+        if tap_ax == "CUSTOM":
+            if Vector(pg.taper_axis).length == 0 or Vector(pg.taper_move).length == 0:
+                self.report({"ERROR"}, PDT_ERR_TAPER_AXIS)
+                return {"FINISHED"}
+            # Work in World space, so the Pivot & Axes are used as shown
+            world = snapshot.transformed(obj.matrix_world).vert_coords(vert_indices)
+            offsets = cm.taper_offsets(world, pg.pivot_loc, pg.taper_axis, pg.taper_move, tan_v)
+            try:
+                offsets = offsets @ np.linalg.inv(np.array(obj.matrix_world)[:3, :3]).T
+            except np.linalg.LinAlgError:
+                self.report({"ERROR"}, f"{PDT_ERR_ZERO_SCALE} {obj.name}")
+                return {"FINISHED"}
+        elif len(bm.select_history) < 1:
             errmsg = f"{PDT_ERR_TAPER_SEL} {len(bm.select_history)})"
             self.report({"ERROR"}, errmsg)
             return {"FINISHED"}
-        for v in [v for v in bm.verts if v.select]:
-            if pg.plane == "LO":
-                v_loc = viewCoords(v.co.x, v.co.y, v.co.z)
-                dis_v = sqrt((viewV.x - v_loc.x) ** 2 + (viewV.y - v_loc.y) ** 2)
-                x_loc = dis_v * tan(ang_v * pi / 180)
-                vm = viewDir(x_loc, 0)
-                v.co = v.co - vm
-            else:
-                dis_v = sqrt((rotV.co[a3] - v.co[a3]) ** 2 + (rotV.co[a2] - v.co[a2]) ** 2)
-                v.co[a2] = v.co[a2] - (dis_v * tan(ang_v * pi / 180))
+        elif pg.plane == "LO":
+            view = ViewTransform()
+            offsets = cm.taper_offsets(
+                coords, bm.select_history[-1].co, view.to_world((0, 0, 1)),
+                view.to_world((1, 0, 0)), tan_v
+            )
+        else:
+            a1, a2, _ = setAxis(tap_ax)
+            offsets = cm.taper_offsets(
+                coords, bm.select_history[-1].co, np.eye(3)[a1], np.eye(3)[a2], tan_v
+            )
+        cm.set_vert_coords(bm, vert_indices, coords + offsets)
         bmesh.update_edit_mesh(obj.data)
         bm.select_history.clear()
         return {"FINISHED"}
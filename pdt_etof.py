@@ -26,12 +26,20 @@
 #
 import bpy
 import bmesh
+from mathutils.bvhtree import BVHTree
 from mathutils.geometry import intersect_line_plane
+from .pdt_functions import merge_verts
 from .pdt_msg_strings import (
+    PDT_ERR_ETOF_HITS,
+    PDT_ERR_ETOF_TARGET,
     PDT_ERR_NOINT,
+    PDT_ERR_NO_OPEN_EDGES,
     PDT_ERR_SEL_1_E_1_F
 )
 
+# Ends closer than this to a face are already touching it
+TOUCH_DIST = 0.0001
+
 
 def failure_message(self):
     """Warn to the user to select 1 edge and 1 face."""
@@ -104,6 +112,126 @@ def extend_vertex(self):
         failure_message_on_plane(self)
 
 
+def open_ends(edge):
+    """Return the Vertices of an Edge not connected to other Geometry."""
+    return [v for v in edge.verts if len(v.link_edges) == 1]
+
+
+def faces_tree(bm, faces):
+    """Build a BVHTree over some Faces of a BMesh.
+
+    Args:
+        bm:           is a bmesh representation
+        faces:        list of BMFaces.
+
+    Returns:
+        BVHTree in the bmesh's space.
+    """
+
+    index = {}
+    verts = []
+    polygons = []
+    for face in faces:
+        polygon = []
+        for v in face.verts:
+            if v not in index:
+                index[v] = len(verts)
+                verts.append(v.co.copy())
+            polygon.append(index[v])
+        polygons.append(polygon)
+    return BVHTree.FromPolygons(verts, polygons)
+
+
+def extend_edges(bm, edges, tree, matrix=None):
+    """Extend Open Edges to the Nearest Face they Point at.
+
+    Each open end is cast along its edge, away from the other end, and the nearest
+    hit over both ends wins. New vertices and edges are added in one pass.
+
+    Args:
+        bm:           is a bmesh representation
+        edges:        list of BMEdges to extend
+        tree:         BVHTree of the target faces
+        matrix:       optional matrix from the bmesh's space to the tree's space.
+
+    Returns:
+        List of new edges.
+    """
+
+    inverse = matrix.inverted() if matrix is not None else None
+    extensions = []
+    for edge in edges:
+        best = None
+        for v in open_ends(edge):
+            origin = v.co
+            direction = v.co - edge.other_vert(v).co
+            if direction.length < TOUCH_DIST:
+                continue
+            if matrix is not None:
+                origin = matrix @ origin
+                direction = matrix.to_3x3() @ direction
+            hit, _, _, dist = tree.ray_cast(origin, direction)
+            if hit is None:
+                continue
+            if inverse is not None:
+                hit = inverse @ hit
+                dist = (hit - v.co).length
+            if dist > TOUCH_DIST and (best is None or dist < best[2]):
+                best = (v, hit, dist)
+        if best is not None:
+            extensions.append(best[:2])
+
+    new_verts = [bm.verts.new(hit) for _, hit in extensions]
+    new_edges = [bm.edges.new((v, new_vert)) for (v, _), new_vert in zip(extensions, new_verts)]
+    # Stubs reaching the same point meet in one vertex
+    merge_verts(bm, new_verts)
+    return new_edges
+
+
+def extend_to_target(self, context):
+    """Extends all Selected Open Edges to the Target Faces.
+
+    The target is either the selected faces, or the faces of the target object.
+
+    Args:
+        context: Blender bpy.context instance.
+
+    Returns:
+        Nothing."""
+
+    pg = context.scene.pdt_pg
+    obj = context.edit_object
+    me = obj.data
+    bm = bmesh.from_edit_mesh(me)
+
+    faces = [f for f in bm.faces if f.select and not f.hide]
+    edges = [
+        e for e in bm.edges if e.select and not e.hide and not e.link_faces and open_ends(e)
+    ]
+    if not edges:
+        self.report({"ERROR"}, PDT_ERR_NO_OPEN_EDGES)
+        return
+
+    matrix = None
+    if pg.etof_target == "FACES":
+        if not faces:
+            self.report({"ERROR"}, PDT_ERR_ETOF_TARGET)
+            return
+        tree = faces_tree(bm, faces)
+    else:
+        target = pg.etof_object
+        if target is None or target == obj or target.type != "MESH":
+            self.report({"ERROR"}, PDT_ERR_ETOF_TARGET)
+            return
+        tree = BVHTree.FromObject(target, context.evaluated_depsgraph_get())
+        matrix = target.matrix_world.inverted() @ obj.matrix_world
+
+    if not extend_edges(bm, edges, tree, matrix):
+        self.report({"ERROR"}, PDT_ERR_ETOF_HITS)
+        return
+    bmesh.update_edit_mesh(me)
+
+
 class PDT_OT_EdgeToFace(bpy.types.Operator):
     """Extend Selected Edge to Projected Intersection with Selected Face."""
 
@@ -120,7 +248,7 @@ class PDT_OT_EdgeToFace(bpy.types.Operator):
         return all([bool(ob), ob.type == "MESH", ob.mode == "EDIT"])
 
     def execute(self, context):
-        """Extends Disconnected Edge to Intersect with Face.
+        """Extends Disconnected Edges to Intersect with Faces.
 
         Args:
             context: Blender bpy.context instance.
@@ -128,5 +256,8 @@ class PDT_OT_EdgeToFace(bpy.types.Operator):
         Returns:
             Status Set."""
 
-        extend_vertex(self)
+        if context.scene.pdt_pg.etof_target == "PLANE":
+            extend_vertex(self)
+        else:
+            extend_to_target(self, context)
         return {"FINISHED"}
@@ -28,15 +28,14 @@ import bmesh
 import bgl
 import gpu
 import numpy as np
-from mathutils import Vector, Quaternion
+from mathutils import Matrix, Vector, Quaternion
+from mathutils.kdtree import KDTree
 from gpu_extras.batch import batch_for_shader
 from math import cos, sin, pi
 from .pdt_msg_strings import (
     PDT_ERR_VERT_MODE,
     PDT_ERR_SEL_2_V_1_E,
-    PDT_ERR_SEL_2_OBJS,
-    PDT_ERR_NO_ACT_OBJ,
-    PDT_ERR_SEL_1_EDGEM
+    PDT_ERR_SEL_2_OBJS
 )
 
 
@@ -88,6 +87,62 @@ def oops(self, context):
     self.layout.label(text=pg.error)
 
 
+def report_error(pg, message):
+    """Set pg.error and show it in a popup, unless Blender runs without its UI.
+
+    Args:
+        pg: PDT Scene Properties
+        message: Error message.
+
+    Returns:
+        Nothing.
+    """
+
+    pg.error = message
+    if not bpy.app.background:
+        bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+
+
+# View Matrix used in place of the first 3D View's, see set_view_matrix
+_view_matrix = None
+
+
+def set_view_matrix(matrix):
+    """Use an explicit View Matrix for View (LO) oriented input.
+
+    Needed when Blender runs without a screen, e.g. in background mode.
+
+    Args:
+        matrix: 4x4 View Matrix, or None to use the first 3D View again.
+
+    Returns:
+        The View Matrix set before, or None.
+    """
+
+    global _view_matrix
+    previous = _view_matrix
+    _view_matrix = matrix
+    return previous
+
+
+def view_matrix():
+    """Return the View Matrix set by set_view_matrix, else the first 3D View's.
+
+    Returns:
+        4x4 Matrix, or None if there is neither.
+    """
+
+    if _view_matrix is not None:
+        return _view_matrix
+    screen = bpy.context.screen
+    if screen is None:
+        return None
+    areas = [a for a in screen.areas if a.type == "VIEW_3D"]
+    if len(areas) > 0:
+        return areas[0].spaces.active.region_3d.view_matrix
+    return None
+
+
 def setMode(mode_pl):
     """Sets Active Axes for View Orientation.
 
@@ -214,79 +269,113 @@ def updateSel(bm, verts, edges, faces):
         f.select_set(True)
 
 
-def viewCoords(x_loc, y_loc, z_loc):
-    """Converts input Vector values to new Screen Oriented Vector.
+def merge_verts(bm, verts, dist=0.0001, neighbours=False):
+    """Weld Vertices that are within dist of each other.
+
+    Only the vertices given are considered, so the cost depends on how many
+    vertices were created or moved, not on the size of the mesh. Pass the new
+    vertices together with the existing ones they may land on. Where vertices
+    are welded, the one earliest in verts is kept.
+
+    With neighbours set, any other vertex of the mesh within dist of the vertices
+    kept is welded into them too, for new geometry that may land anywhere. That
+    search is one pass of bmesh.ops.find_doubles over the mesh.
 
     Args:
-        x_loc: X coordinate from vector
-        y_loc: Y coordinate from vector
-        z_loc: Z coordinate from vector
+        bm: Object Bmesh
+        verts: Vertices to weld, in order of preference
+        dist: Merge Distance
+        neighbours: Also weld the other vertices of the mesh into them
 
     Returns:
-        Vector adjusted to View's Inverted Tranformation Matrix.
+        Dictionary of removed vertex and the vertex it was welded into.
+    """
+    verts = [v for v in dict.fromkeys(verts) if v.is_valid]
+    targetmap = {}
+    if len(verts) > 1:
+        tree = KDTree(len(verts))
+        for i, v in enumerate(verts):
+            tree.insert(v.co, i)
+        tree.balance()
+        for i, v in enumerate(verts):
+            if v in targetmap:
+                continue
+            for _, j, _ in tree.find_range(v.co, dist):
+                if j > i and verts[j] not in targetmap:
+                    targetmap[verts[j]] = v
+    if neighbours and verts:
+        keep = [v for v in verts if v not in targetmap]
+        found = bmesh.ops.find_doubles(bm, verts=bm.verts, keep_verts=keep, dist=dist)
+        for v, target in found["targetmap"].items():
+            targetmap.setdefault(v, target)
+    if targetmap:
+        bmesh.ops.weld_verts(bm, targetmap=targetmap)
+    return targetmap
+
+
+class ViewTransform:
+    """Rotation between World and View Axes, for View (LO) plane input.
+
+    Reads the view matrix once, see view_matrix, so build one per operator run and
+    use it for all the points. Points can be one coordinate triple or an (N, 3)
+    array, transformed with one matrix multiply. Without a view, every point maps
+    to the origin.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        vm = areas[0].spaces.active.region_3d.view_matrix
-        vm = vm.to_3x3().normalized().inverted()
-        vl = Vector((x_loc, y_loc, z_loc))
-        vw = vm @ vl
-        return vw
-    else:
-        return Vector((0, 0, 0))
+    def __init__(self, matrix=None):
+        if matrix is None:
+            matrix = view_matrix()
+        if matrix is None:
+            self._to_view = np.zeros((3, 3))
+            self._to_world = np.zeros((3, 3))
+        else:
+            rotation = matrix.to_3x3().normalized()
+            self._to_view = np.array(rotation)
+            self._to_world = np.array(rotation.inverted())
 
+    @staticmethod
+    def _apply(rotation, coords):
+        """Rotate coords, a Vector for one point, else an (N, 3) array."""
+        coords = np.asarray(coords, dtype=np.float64)
+        result = coords @ rotation.T
+        return Vector(result) if coords.ndim == 1 else result
 
-def viewCoordsI(x_loc, y_loc, z_loc):
-    """Converts Screen Oriented input Vector values to new World Vector.
+    def to_world(self, coords):
+        """Convert View Oriented Coordinates to World Coordinates.
 
-    Converts View tranformation Matrix to Rotational Matrix
+        Args:
+            coords: Coordinates, (3,) or (N, 3).
 
-    Args:
-        x_loc: X coordinate from vector
-        y_loc: Y coordinate from vector
-        z_loc: Z coordinate from vector
+        Returns:
+            Vector for one point, else (N, 3) array.
+        """
 
-    Returns:
-        Vector adjusted to View's Transformation Matrix.
-    """
+        return self._apply(self._to_world, coords)
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        vm = areas[0].spaces.active.region_3d.view_matrix
-        vm = vm.to_3x3().normalized()
-        vl = Vector((x_loc, y_loc, z_loc))
-        vw = vm @ vl
-        return vw
-    else:
-        return Vector((0, 0, 0))
+    def to_view(self, coords):
+        """Convert World Coordinates to View Oriented Coordinates.
 
+        Args:
+            coords: Coordinates, (3,) or (N, 3).
 
-def viewDir(dis_v, ang_v):
-    """Converts Distance and Angle to View Oriented Vector.
+        Returns:
+            Vector for one point, else (N, 3) array.
+        """
 
-    Converts View Transformation Matrix to Rotational Matrix (3x3)
-    Angles are converted to Radians from degrees.
+        return self._apply(self._to_view, coords)
 
-    Args:
-        dis_v: Scene distance
-        ang_v: Scene angle
+    def direction(self, dis_v, ang_v):
+        """Convert Distance and Angle in the View Plane to a World Vector.
 
-    Returns:
-        World Vector.
-    """
+        Args:
+            dis_v: Distance
+            ang_v: Angle in degrees, from the view's X axis.
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        vm = areas[0].spaces.active.region_3d.view_matrix
-        vm = vm.to_3x3().normalized().inverted()
-        vl = Vector((0, 0, 0))
-        vl.x = dis_v * cos(ang_v * pi / 180)
-        vl.y = dis_v * sin(ang_v * pi / 180)
-        vw = vm @ vl
-        return vw
-    else:
-        return Vector((0, 0, 0))
+        Returns:
+            World Vector.
+        """
+
+        return self.to_world((dis_v * cos(ang_v * pi / 180), dis_v * sin(ang_v * pi / 180), 0))
 
 
 def euler_to_quaternion(roll, pitch, yaw):
@@ -362,12 +451,9 @@ def intersection(actV, othV, lstV, fstV, plane):
     """
 
     if plane == "LO":
-        disV = othV - actV
-        othV = viewCoordsI(disV.x, disV.y, disV.z)
-        disV = lstV - actV
-        lstV = viewCoordsI(disV.x, disV.y, disV.z)
-        disV = fstV - actV
-        fstV = viewCoordsI(disV.x, disV.y, disV.z)
+        view = ViewTransform()
+        offsets = np.array([othV, lstV, fstV]) - np.array(actV)
+        othV, lstV, fstV = (Vector(co) for co in view.to_view(offsets))
         refV = Vector((0, 0, 0))
         ap1 = (fstV.x, fstV.y)
         ap2 = (lstV.x, lstV.y)
@@ -400,7 +486,7 @@ def intersection(actV, othV, lstV, fstV, plane):
     elif plane == "YZ":
         vector_delta = Vector((ly, nx, nz))
     elif plane == "LO":
-        vector_delta = viewCoords(nx, nz, ly) + actV
+        vector_delta = view.to_world((nx, nz, ly)) + actV
     return vector_delta, True
 
 
@@ -433,20 +519,17 @@ def getPercent(obj, flip_p, per_v, data, scene):
             actV = verts[0].co
             othV = verts[1].co
             if actV is None:
-                pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                report_error(pg, PDT_ERR_VERT_MODE)
                 return None
         else:
-            pg.error = PDT_ERR_SEL_2_V_1_E + str(len(verts)) + " Vertices"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            report_error(pg, PDT_ERR_SEL_2_V_1_E + str(len(verts)) + " Vertices")
             return None
         p1 = np.array([actV.x, actV.y, actV.z])
         p2 = np.array([othV.x, othV.y, othV.z])
     if obj.mode == "OBJECT":
         objs = bpy.context.view_layer.objects.selected
         if len(objs) != 2:
-            pg.error = PDT_ERR_SEL_2_OBJS + str(len(objs)) + ")"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            report_error(pg, PDT_ERR_SEL_2_OBJS + str(len(objs)) + ")")
             return None
         p1 = np.array(
             [
@@ -471,52 +554,6 @@ def getPercent(obj, flip_p, per_v, data, scene):
     return Vector((V[0], V[1], V[2]))
 
 
-def objCheck(obj, scene, oper):
-    """Check Object & Selection Validity.
-
-    Args:
-        obj: Active Object
-        scene: Active Scene
-        oper: Operation to check
-
-    Returns:
-        Object Bmesh and Validity Boolean.
-    """
-
-    pg = scene.pdt_pg
-    _oper = oper.upper()
-
-    if obj is None:
-        pg.error = PDT_ERR_NO_ACT_OBJ
-        bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return None, False
-    if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
-        if _oper == "S":
-            if len(bm.edges) < 1:
-                pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(bm.edges)})"
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return None, False
-            else:
-                return bm, True
-        if len(bm.select_history) >= 1:
-            if _oper not in {"D", "E", "G", "N", "S"}:
-                actV = checkSelection(1, bm, obj)
-            else:
-                verts = [v for v in bm.verts if v.select]
-                if len(verts) > 0:
-                    actV = verts[0]
-                else:
-                    actV = None
-            if actV is None:
-                pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                return None, False
-        return bm, True
-    elif obj.mode == "OBJECT":
-        return None, True
-
-
 def disAng(vals, flip_a, plane, scene):
     """Set Working Axes when using Direction command.
 
@@ -540,7 +577,7 @@ def disAng(vals, flip_a, plane, scene):
             ang_v = ang_v + 180
         pg.angle = ang_v
     if plane == "LO":
-        vector_delta = viewDir(dis_v, ang_v)
+        vector_delta = ViewTransform().direction(dis_v, ang_v)
     else:
         a1, a2, _ = setMode(plane)
         vector_delta = Vector((0, 0, 0))
@@ -552,44 +589,107 @@ def disAng(vals, flip_a, plane, scene):
     return vector_delta
 
 
-# Shader for displaying the Pivot Point as Graphics.
+# Shaders for displaying Graphics, one colour per batch or per vertex.
 #
 shader = gpu.shader.from_builtin("3D_UNIFORM_COLOR") if not bpy.app.background else None
+colour_shader = gpu.shader.from_builtin("3D_SMOOTH_COLOR") if not bpy.app.background else None
 
+# Cached Pivot Point batches, None until built or after a style change
+_pivot_graphic = {"batches": None}
 
-def draw3D(coords, gtype, rgba, context):
-    """Draw Pivot Point Graphics.
 
-    Draws either Lines Points, or Tris using defined shader
+def draw_batch(batch, rgba, point_size=None):
+    """Draw a prepared Batch using defined shader.
+
+    Lets callers build a batch once with batch_for_shader and draw it on every redraw.
 
     Args:
-        coords: Input Coordinates List
-        gtype: Graphic Type
+        batch: GPU batch created for the defined shader
         rgba: Colour in RGBA format
-        context: Blender bpy.context instance.
+        point_size: Optional size in pixels for POINTS batches.
 
     Returns:
         Nothing.
     """
 
-    batch = batch_for_shader(shader, gtype, {"pos": coords})
-
     try:
-        if coords is not None:
-            bgl.glEnable(bgl.GL_BLEND)
-            shader.bind()
-            shader.uniform_float("color", rgba)
-            batch.draw(shader)
+        bgl.glEnable(bgl.GL_BLEND)
+        if point_size is not None:
+            bgl.glPointSize(point_size)
+        shader.bind()
+        shader.uniform_float("color", rgba)
+        batch.draw(shader)
+        if point_size is not None:
+            bgl.glPointSize(1)
     except:
         pass
 
 
+def pivot_batches(pg):
+    """Build the Pivot Point Graphic in Unit Space.
+
+    Each axis is an arrow of length 1 from the origin, coloured Red; X axis, Green;
+    Y axis, Blue; Z axis, with a yellow point at the centre. Only the arrow width
+    and the alpha are built in, the location & size are applied when drawn.
+
+    Args:
+        pg: PDT Scene Properties.
+
+    Returns:
+        TRIS, LINES and POINTS batches for the per-vertex colour shader.
+    """
+
+    b = 0.65
+    c = 0.05 + (pg.pivot_width * 0.02)
+    o = c / 3
+    alpha = pg.pivot_alpha
+    axes = (
+        (Vector((1, 0, 0)), Vector((0, 1, 0)), (1.0, 0.0, 0.0, alpha)),
+        (Vector((0, 1, 0)), Vector((1, 0, 0)), (0.0, 1.0, 0.0, alpha)),
+        (Vector((0, 0, 1)), Vector((1, 0, 0)), (0.2, 0.5, 1.0, alpha)),
+    )
+    origin = Vector((0, 0, 0))
+    tris, tri_colours, lines, line_colours = [], [], [], []
+    for axis, spread, colour in axes:
+        tip = axis * b
+        # fmt: off
+        tris += [
+            origin, tip - spread * o, tip + spread * o,
+            axis, tip + spread * c, tip - spread * c,
+        ]
+        # fmt: on
+        tri_colours += [colour] * 6
+        lines += [origin, axis]
+        line_colours += [colour] * 2
+    return (
+        batch_for_shader(colour_shader, "TRIS", {"pos": tris, "color": tri_colours}),
+        batch_for_shader(colour_shader, "LINES", {"pos": lines, "color": line_colours}),
+        batch_for_shader(
+            colour_shader, "POINTS", {"pos": [origin], "color": [(1.0, 1.0, 0.0, alpha)]}
+        ),
+    )
+
+
+def pivot_mark_dirty(*args):
+    """Rebuild the Pivot Point Graphic on its next Redraw, and redraw the 3D Views."""
+    _pivot_graphic["batches"] = None
+    pivot_redraw()
+
+
+def pivot_redraw(*args):
+    """Redraw the 3D Views, after the Pivot Point moved or was resized."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
 def drawCallback3D(self, context):
-    """Create Coordinate List for Pivot Point Graphic.
+    """Draw the Pivot Point Graphic.
 
-    Creates coordinates for Pivot Point Graphic consisting of 6 Tris
-    and one Point colour coded Red; X axis, Green; Y axis, Blue; Z axis
-    and a yellow point based upon screen scale
+    The graphic is built once by pivot_batches and drawn through a model matrix
+    that moves it to the Pivot Point and sizes it for the view being drawn, so a
+    redraw only builds that matrix.
 
     Args:
         context: Blender bpy.context instance.
@@ -598,74 +698,29 @@ def drawCallback3D(self, context):
         Nothing.
     """
 
-    scene = context.scene
-    pg = scene.pdt_pg
-    w = context.region.width
-    x = pg.pivot_loc.x
-    y = pg.pivot_loc.y
-    z = pg.pivot_loc.z
+    pg = context.scene.pdt_pg
+    if _pivot_graphic["batches"] is None:
+        _pivot_graphic["batches"] = pivot_batches(pg)
     # Scale it from view
-    areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        sf = abs(areas[0].spaces.active.region_3d.window_matrix.decompose()[2][1])
+    rv3d = context.region_data
+    sf = abs(rv3d.window_matrix.decompose()[2][1])
     # Check for orhtographic view and resize
-    if areas[0].spaces.active.region_3d.is_orthographic_side_view:
-        a = w / sf / 60000 * pg.pivot_size
+    if rv3d.is_orthographic_side_view:
+        a = context.region.width / sf / 60000 * pg.pivot_size
     else:
-        a = w / sf / 5000 * pg.pivot_size
-    b = a * 0.65
-    c = a * 0.05 + (pg.pivot_width * a * 0.02)
-    o = c / 3
+        a = context.region.width / sf / 5000 * pg.pivot_size
 
-    # fmt: off
-    # X Axis
-    coords = [
-        (x, y, z),
-        (x+b, y-o, z),
-        (x+b, y+o, z),
-        (x+a, y, z),
-        (x+b, y+c, z),
-        (x+b, y-c, z),
-    ]
-    # fmt: on
-    colour = (1.0, 0.0, 0.0, pg.pivot_alpha)
-    draw3D(coords, "TRIS", colour, context)
-    coords = [(x, y, z), (x+a, y, z)]
-    draw3D(coords, "LINES", colour, context)
-    # fmt: off
-    # Y Axis
-    coords = [
-        (x, y, z),
-        (x-o, y+b, z),
-        (x+o, y+b, z),
-        (x, y+a, z),
-        (x+c, y+b, z),
-        (x-c, y+b, z),
-    ]
-    # fmt: on
-    colour = (0.0, 1.0, 0.0, pg.pivot_alpha)
-    draw3D(coords, "TRIS", colour, context)
-    coords = [(x, y, z), (x, y + a, z)]
-    draw3D(coords, "LINES", colour, context)
-    # fmt: off
-    # Z Axis
-    coords = [
-        (x, y, z),
-        (x-o, y, z+b),
-        (x+o, y, z+b),
-        (x, y, z+a),
-        (x+c, y, z+b),
-        (x-c, y, z+b),
-    ]
-    # fmt: on
-    colour = (0.2, 0.5, 1.0, pg.pivot_alpha)
-    draw3D(coords, "TRIS", colour, context)
-    coords = [(x, y, z), (x, y, z + a)]
-    draw3D(coords, "LINES", colour, context)
-    # Centre
-    coords = [(x, y, z)]
-    colour = (1.0, 1.0, 0.0, pg.pivot_alpha)
-    draw3D(coords, "POINTS", colour, context)
+    gpu.matrix.push()
+    try:
+        bgl.glEnable(bgl.GL_BLEND)
+        gpu.matrix.multiply_matrix(Matrix.Translation(pg.pivot_loc) @ Matrix.Scale(a, 4))
+        colour_shader.bind()
+        for batch in _pivot_graphic["batches"]:
+            batch.draw(colour_shader)
+    except:
+        pass
+    finally:
+        gpu.matrix.pop()
 
 
 def scale_set(self, context):
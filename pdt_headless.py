@@ -0,0 +1,207 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+"""Run PDT Command Scripts, or Journals, on named Objects without the Blender UI.
+
+With the add-on enabled (here installed as clockworxpdt):
+
+    blender --background --python-expr \\
+        "import sys, clockworxpdt.pdt_headless as h; sys.exit(h.main())" \\
+        -- --blend drawing.blend --script commands.txt --objects Plan Section
+
+Everything after -- is read by main, see parse_args. Each problem is printed to
+stdout as one JSON object per line, followed by a summary line, e.g.
+
+    {"object": "Plan", "line": 3, "command": "nd1,0", "error": "Bad Command ..."}
+    {"status": "failed", "objects": 2, "commands": 12, "errors": 1, "output": "..."}
+
+main returns 0 when every command ran, 1 when any failed and 2 for bad arguments.
+"""
+import argparse
+import json
+import sys
+import bpy
+from mathutils import Matrix
+from .pdt_command import replay_journal, run_script, script_lines
+from .pdt_functions import set_view_matrix
+from .pdt_msg_strings import (
+    PDT_ERR_NOT_MESH,
+    PDT_ERR_NO_OBJECT,
+    PDT_ERR_NO_SAVE_PATH,
+)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Argument Parser that raises its Errors, so main can report them as JSON."""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def emit(**record):
+    """Print a Record to stdout as one Line of JSON."""
+    print(json.dumps(record), flush=True)
+
+
+def parse_args(argv):
+    """Parse the Arguments given after -- on the Blender command line.
+
+    Args:
+        argv: list of argument strings.
+
+    Returns:
+        argparse Namespace.
+
+    Raises:
+        ValueError: If the arguments are not valid.
+    """
+
+    parser = _ArgumentParser(prog="pdt_headless", description=__doc__.splitlines()[0])
+    parser.add_argument("--blend", help=".blend file to open, else the one Blender opened")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--script", help="File of PDT commands, one per line")
+    source.add_argument("--journal", help="PDT command journal to replay")
+    parser.add_argument(
+        "--objects", nargs="+", required=True, help="Objects the commands are run on, in turn"
+    )
+    parser.add_argument(
+        "--mode", choices=("EDIT", "OBJECT"), default="EDIT", help="Mode the commands run in"
+    )
+    parser.add_argument(
+        "--view-matrix",
+        nargs=16,
+        type=float,
+        metavar="M",
+        help="View Matrix for View (LO) plane input, 16 values row by row (default: Top view)",
+    )
+    parser.add_argument("--output", help="File to save to (default: overwrite the .blend)")
+    return parser.parse_args(argv)
+
+
+def apply_to_object(context, obj, lines, runner, mode):
+    """Make obj the only Selected & Active Object and run the Lines on it.
+
+    Args:
+        context: Blender bpy.context instance
+        obj: Object to run the lines on
+        lines: list of script or journal lines
+        runner: run_script or replay_journal
+        mode: "EDIT" or "OBJECT".
+
+    Returns:
+        Number of commands run, and list of (line number, line, message) tuples.
+
+    Raises:
+        RuntimeError: If obj cannot be put in mode.
+    """
+
+    view_layer = context.view_layer
+    if view_layer.objects.active is not None and view_layer.objects.active.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    for ob in view_layer.objects.selected:
+        ob.select_set(False)
+    view_layer.objects.active = obj
+    obj.select_set(True)
+    if mode == "EDIT":
+        bpy.ops.object.mode_set(mode="EDIT")
+    try:
+        return runner(context, lines)
+    finally:
+        if mode == "EDIT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+
+def main(argv=None):
+    """Open a .blend, run a Script or Journal on each named Object and save.
+
+    Args:
+        argv: list of argument strings, by default those after -- in sys.argv.
+
+    Returns:
+        Exit status.
+    """
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    try:
+        args = parse_args(argv)
+    except ValueError as err:
+        emit(status="error", error=str(err))
+        return 2
+
+    try:
+        if args.blend:
+            bpy.ops.wm.open_mainfile(filepath=args.blend)
+        lines = script_lines(None, args.script or args.journal)
+    except (OSError, RuntimeError) as err:
+        emit(status="error", error=str(err))
+        return 1
+    output = args.output or bpy.data.filepath
+    if not output:
+        emit(status="error", error=PDT_ERR_NO_SAVE_PATH)
+        return 1
+
+    if args.view_matrix:
+        values = args.view_matrix
+        set_view_matrix(Matrix([values[i : i + 4] for i in range(0, 16, 4)]))
+    else:
+        set_view_matrix(Matrix.Identity(4))
+    runner = replay_journal if args.journal else run_script
+    commands = 0
+    failures = 0
+    try:
+        for name in args.objects:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                emit(object=name, error=f"{PDT_ERR_NO_OBJECT} {name}")
+                failures += 1
+                continue
+            if args.mode == "EDIT" and obj.type != "MESH":
+                emit(object=name, error=f"{PDT_ERR_NOT_MESH} {name}")
+                failures += 1
+                continue
+            try:
+                count, errors = apply_to_object(bpy.context, obj, lines, runner, args.mode)
+            except (RuntimeError, ValueError) as err:
+                emit(object=name, error=str(err))
+                failures += 1
+                continue
+            commands += count
+            for number, line, message in errors:
+                emit(object=name, line=number, command=line, error=message)
+            failures += len(errors)
+        bpy.ops.wm.save_as_mainfile(filepath=output)
+    except RuntimeError as err:
+        emit(status="error", error=str(err))
+        return 1
+    finally:
+        set_view_matrix(None)
+
+    emit(
+        status="failed" if failures else "ok",
+        objects=len(args.objects),
+        commands=commands,
+        errors=failures,
+        output=output,
+    )
+    return 1 if failures else 0
@@ -0,0 +1,232 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+import bpy
+import bmesh
+from time import perf_counter
+from mathutils import Vector
+from .pdt_msg_strings import (
+    PDT_ERR_JOB_RUNNING,
+    PDT_INF_JOB_CANCEL,
+)
+
+# Seconds between timer events of a running job, and of work done per event
+JOB_INTERVAL = 0.01
+JOB_SLICE = 0.05
+# PDT input fields written by Maths commands and journal replay
+BACKUP_INPUTS = ("distance", "angle", "percent", "plane", "select")
+# Events still passed on to Blender while a job runs, so the view can be navigated
+NAVIGATION_EVENTS = {
+    "MIDDLEMOUSE",
+    "WHEELUPMOUSE",
+    "WHEELDOWNMOUSE",
+    "TRACKPADPAN",
+    "TRACKPADZOOM",
+    "MOUSEMOVE",
+    "INBETWEEN_MOUSEMOVE",
+}
+
+
+def run_job(steps):
+    """Run a Job Generator to the End.
+
+    Args:
+        steps: generator yielding its progress, from 0.0 to 1.0.
+
+    Returns:
+        The generator's return value.
+    """
+
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+class JobBackup:
+    """State put back when a Job is Cancelled.
+
+    Holds a copy of the Active Object's mesh when it is in Edit mode and backup_mesh
+    is set, the Mesh Select Mode, the Cursor and Pivot Point locations, the PDT
+    input fields and the Selected Objects' matrices.
+    """
+
+    def __init__(self, context, backup_mesh=True):
+        scene = context.scene
+        self.scene = scene
+        self.select_mode = tuple(scene.tool_settings.mesh_select_mode)
+        self.cursor = scene.cursor.location.copy()
+        self.pivot = Vector(scene.pdt_pg.pivot_loc)
+        self.coords = Vector(scene.pdt_pg.cartesian_coords)
+        self.inputs = {name: getattr(scene.pdt_pg, name) for name in BACKUP_INPUTS}
+        self.matrices = [
+            (ob, ob.matrix_world.copy()) for ob in context.view_layer.objects.selected
+        ]
+        self.obj = context.view_layer.objects.active
+        self.mesh = None
+        if (
+            backup_mesh
+            and self.obj is not None
+            and self.obj.type == "MESH"
+            and self.obj.mode == "EDIT"
+        ):
+            self.mesh = bpy.data.meshes.new("PDT Job Backup")
+            bmesh.from_edit_mesh(self.obj.data).to_mesh(self.mesh)
+
+    def restore(self):
+        """Put the State back, then free the Backup."""
+        if self.mesh is not None:
+            bm = bmesh.from_edit_mesh(self.obj.data)
+            bm.clear()
+            bm.from_mesh(self.mesh)
+            bmesh.update_edit_mesh(self.obj.data)
+        for ob, matrix in self.matrices:
+            ob.matrix_world = matrix
+        self.scene.tool_settings.mesh_select_mode = self.select_mode
+        self.scene.cursor.location = self.cursor
+        self.scene.pdt_pg.pivot_loc = self.pivot
+        self.scene.pdt_pg.cartesian_coords = self.coords
+        for name, value in self.inputs.items():
+            setattr(self.scene.pdt_pg, name, value)
+        self.free()
+
+    def free(self):
+        """Remove the Mesh Copy."""
+        if self.mesh is not None:
+            bpy.data.meshes.remove(self.mesh)
+            self.mesh = None
+
+
+def redraw_views(context):
+    """Redraw the 3D Views, which show the job's progress in the PDT panels."""
+    for area in context.screen.areas:
+        if area.type == "VIEW_3D":
+            area.tag_redraw()
+
+
+class JobOperator:
+    """Mixin running an Operator's Job Generator.
+
+    Subclasses define job(context), a generator that does the operator's work and
+    yields its progress from 0.0 to 1.0 between steps. execute runs the job to the
+    end, as needed for scripts, redo and background mode. invoke runs it as a modal
+    job: a slice of steps on each timer event, progress shown in the PDT panels and
+    ESC to cancel, which puts back the state saved in a JobBackup. Only one job runs
+    at a time.
+
+    A modal job is handed bpy.context, as the context given to invoke is not valid
+    in later timer events. Jobs that only change the mesh in their last step set
+    job_backup_mesh to False, to skip copying the whole mesh for the backup.
+    """
+
+    job_backup_mesh = True
+
+    def job(self, context):
+        """Generator doing the Operator's work, see the class docstring."""
+        raise NotImplementedError
+
+    def execute(self, context):
+        """Run the Job to the End.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        run_job(self.job(context))
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        """Start the Job as a Modal Operator.
+
+        Args:
+            context: Blender bpy.context instance
+            event: Event that invoked the operator.
+
+        Returns:
+            Status Set.
+        """
+
+        wm = context.window_manager
+        if wm.pdt_job_name:
+            self.report({"ERROR"}, f"{PDT_ERR_JOB_RUNNING} {wm.pdt_job_name}")
+            return {"CANCELLED"}
+        self._backup = JobBackup(context, self.job_backup_mesh)
+        self._steps = self.job(bpy.context)
+        self._timer = wm.event_timer_add(JOB_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        wm.pdt_job_name = self.bl_label
+        wm.pdt_job_progress = 0.0
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        """Run a Slice of the Job, or Cancel it on ESC.
+
+        Args:
+            context: Blender bpy.context instance
+            event: Current event.
+
+        Returns:
+            Status Set.
+        """
+
+        if event.type == "ESC":
+            self._steps.close()
+            self._backup.restore()
+            self._end(context)
+            self.report({"WARNING"}, f"{PDT_INF_JOB_CANCEL} {self.bl_label}")
+            return {"CANCELLED"}
+        if event.type != "TIMER":
+            if event.type in NAVIGATION_EVENTS:
+                return {"PASS_THROUGH"}
+            # Nothing else may change the scene under the job
+            return {"RUNNING_MODAL"}
+
+        progress = context.window_manager.pdt_job_progress
+        deadline = perf_counter() + JOB_SLICE
+        try:
+            while perf_counter() < deadline:
+                progress = next(self._steps)
+        except StopIteration:
+            self._backup.free()
+            self._end(context)
+            return {"FINISHED"}
+        except Exception as err:
+            self._backup.restore()
+            self._end(context)
+            self.report({"ERROR"}, f"{type(err).__name__}: {err}")
+            return {"CANCELLED"}
+        context.window_manager.pdt_job_progress = progress
+        redraw_views(context)
+        return {"RUNNING_MODAL"}
+
+    def _end(self, context):
+        """Remove the Timer and clear the Progress shown."""
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.pdt_job_name = ""
+        wm.pdt_job_progress = 0.0
+        redraw_views(context)
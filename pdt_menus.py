@@ -30,17 +30,23 @@ from .pdt_msg_strings import (
     PDT_LAB_ANGLEVALUE,
     PDT_LAB_ARCCENTRE,
     PDT_LAB_BISECT,
+    PDT_LAB_BISECTPAIRS,
+    PDT_LAB_CUTTERS,
     PDT_LAB_CVALUE,
     PDT_LAB_DEL,
     PDT_LAB_DIR,
     PDT_LAB_DISVALUE,
     PDT_LAB_EDGETOEFACE,
+    PDT_LAB_ETOFTARGET,
     PDT_LAB_FILLET,
     PDT_LAB_FLIPANGLE,
     PDT_LAB_FLIPPERCENT,
     PDT_LAB_INTERSECT,
     PDT_LAB_INTERSETALL,
+    PDT_LAB_INTERSETOBJS,
+    PDT_LAB_JOBCANCEL,
     PDT_LAB_JOIN2VERTS,
+    PDT_LAB_JOURNAL,
     PDT_LAB_MODE,
     PDT_LAB_NOR,
     PDT_LAB_OPERATION,
@@ -56,9 +62,13 @@ from .pdt_msg_strings import (
     PDT_LAB_PLANE,
     PDT_LAB_PROFILE,
     PDT_LAB_RADIUS,
+    PDT_LAB_REPLAY,
+    PDT_LAB_SCRIPT,
     PDT_LAB_SEGMENTS,
     PDT_LAB_TAPER,
     PDT_LAB_TAPERAXES,
+    PDT_LAB_TJUNCDIST,
+    PDT_LAB_TJUNCTIONS,
     PDT_LAB_TOOLS,
     PDT_LAB_USEVERTS,
     PDT_LAB_VARIABLES
@@ -67,6 +77,17 @@ from .pdt_msg_strings import (
 
 # PDT Panel menus
 #
+def draw_job_progress(layout, context):
+    """Show the Progress of a Running PDT Job."""
+    wm = context.window_manager
+    if wm.pdt_job_name:
+        box = layout.box()
+        row = box.row()
+        row.prop(wm, "pdt_job_progress", text=wm.pdt_job_name, slider=True)
+        row = box.row()
+        row.label(text=PDT_LAB_JOBCANCEL)
+
+
 class PDT_PT_PanelDesign(Panel):
     bl_idname = "PDT_PT_PanelDesign"
     bl_label = "PDT Design"
@@ -78,6 +99,7 @@ class PDT_PT_PanelDesign(Panel):
     def draw(self, context):
         layout = self.layout
         pdt_pg = context.scene.pdt_pg
+        draw_job_progress(layout, context)
         #
         # Working Plane
         row = layout.row()
@@ -169,14 +191,42 @@ class PDT_PT_PanelDesign(Panel):
         row.operator("pdt.join", text=PDT_LAB_JOIN2VERTS)
         row.operator("pdt.linetobisect", text=PDT_LAB_BISECT)
         row = toolbox.row()
+        row.label(text=PDT_LAB_BISECTPAIRS)
+        row.prop(pdt_pg, "bisect_pairs", text="")
+        row = toolbox.row()
         row.operator("pdt.edge_to_face", text=PDT_LAB_EDGETOEFACE)
         row.operator("pdt.intersectall", text=PDT_LAB_INTERSETALL)
+        row = toolbox.row()
+        row.label(text=PDT_LAB_ETOFTARGET)
+        row.prop(pdt_pg, "etof_target", text="")
+        if pdt_pg.etof_target == "OBJECT":
+            row.prop(pdt_pg, "etof_object", text="")
+        row = toolbox.row()
+        row.label(text=PDT_LAB_CUTTERS)
+        row.prop(pdt_pg, "intersect_cutters", text="")
+        if context.window_manager.pdt_xall_preview is False:
+            icon = "HIDE_OFF"
+            txt = "Preview Cuts"
+        else:
+            icon = "HIDE_ON"
+            txt = "Hide Cuts"
+        row.operator("pdt.intersectall_preview", icon=icon, text=txt)
+        row = toolbox.row()
+        row.operator("pdt.intersectall_objects", text=PDT_LAB_INTERSETOBJS)
+        row = toolbox.row()
+        row.operator("pdt.tjunctions", text=PDT_LAB_TJUNCTIONS)
+        row.prop(pdt_pg, "tjunction_dist", text=PDT_LAB_TJUNCDIST)
         #
         # Taper tool
         box = toolbox.box()
         row = box.row()
         row.operator("pdt.taper", text=PDT_LAB_TAPER)
         row.prop(pdt_pg, "taper", text=PDT_LAB_TAPERAXES)
+        if pdt_pg.taper == "CUSTOM":
+            row = box.row()
+            row.prop(pdt_pg, "taper_axis", text="")
+            row = box.row()
+            row.prop(pdt_pg, "taper_move", text="")
         #
         # Fillet tool
         box = toolbox.box()
@@ -225,6 +275,8 @@ class PDT_PT_PanelPivotPoint(Panel):
         col = row.column()
         col.operator("pdt.pivotorigin", icon="EMPTY_AXIS", text="Origin")
         row = layout.row()
+        row.prop(pdt_pg, "pivot_centre", text="")
+        row = layout.row()
         col = row.column()
         col.operator("pdt.viewplanerot", icon="EMPTY_AXIS", text="Rotate")
         col = row.column()
@@ -346,6 +398,7 @@ class PDT_PT_PanelCommandLine(Panel):
     def draw(self, context):
         layout = self.layout
         pdt_pg = context.scene.pdt_pg
+        draw_job_progress(layout, context)
         row = layout.row()
         col = row.column()
         col.prop(pdt_pg, "plane", text="Plane")
@@ -355,3 +408,19 @@ class PDT_PT_PanelCommandLine(Panel):
         row.label(text="Comand Line, uses Plane & Mode Options")
         row = layout.row()
         row.prop(pdt_pg, "command", text="")
+        box = layout.box()
+        row = box.row()
+        row.prop(pdt_pg, "command_text", text="")
+        row = box.row()
+        row.prop(pdt_pg, "command_file", text="")
+        row = box.row()
+        row.operator("pdt.command_script", text=PDT_LAB_SCRIPT)
+        box = layout.box()
+        row = box.row()
+        row.prop(pdt_pg, "journal_record", text=PDT_LAB_JOURNAL)
+        row = box.row()
+        row.prop(pdt_pg, "journal_text", text="")
+        row = box.row()
+        row.prop(pdt_pg, "journal_file", text="")
+        row = box.row()
+        row.operator("pdt.journal_replay", text=PDT_LAB_REPLAY)
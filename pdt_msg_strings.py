@@ -55,8 +55,19 @@ PDT_LAB_AD3D          = "Set A/D 3D"
 PDT_LAB_TAPERAXES     = ""            # Intentionally left blank
 PDT_LAB_TAPER         = "Taper"
 PDT_LAB_INTERSETALL   = "Intersect All"
+PDT_LAB_CUTTERS       = "Cutters"
+PDT_LAB_INTERSETOBJS  = "Intersect Objects"
+PDT_LAB_TJUNCTIONS    = "Repair T-Junctions"
+PDT_LAB_TJUNCDIST     = "Tolerance"
 PDT_LAB_BISECT        = "Bisect"
+PDT_LAB_BISECTPAIRS   = "Bisect Pairs"
+PDT_LAB_SCRIPT        = "Run Script"
+PDT_LAB_SCRIPTLINE    = "Line"
+PDT_LAB_JOBCANCEL     = "Esc to Cancel"
+PDT_LAB_JOURNAL       = "Record Journal"
+PDT_LAB_REPLAY        = "Replay Journal"
 PDT_LAB_EDGETOEFACE   = "Edge-Face"
+PDT_LAB_ETOFTARGET    = "Extend To"
 PDT_LAB_FILLET        = "Fillet"
 PDT_LAB_SEGMENTS      = "Segments"
 PDT_LAB_USEVERTS      = "Use Verts"
@@ -73,6 +84,7 @@ PDT_LAB_PIVOTLOCH     = "Pivot Point Location"
 PDT_ERR_NO_ACT_OBJ    = "No Active Object - Please Select an Object"
 PDT_ERR_NO_ACT_VERT   = "No Active Vertex - Select One Vertex Individually"
 PDT_ERR_NO_SEL_GEOM   = "No Geometry/Objects Selected"
+PDT_ERR_NO_SEL_FACES  = "No Faces Selected, select Faces for a Face Area Centre"
 PDT_ERR_NO_ACT_VERTS  = "No Selected Geometry - Please Select some Geometry"
 PDT_ERR_NON_VALID     = "is Not a Valid Option in Selected Object's Mode for Command:"
 PDT_ERR_VERT_MODE     = "Work in Vertex Mode for this Function"
@@ -97,6 +109,12 @@ PDT_ERR_SEL_1_OBJ     = "Select Exactly 1 Object (Currently selected:"
 PDT_ERR_SEL_2_OBJS    = "Select Exactly 2 Objects (Currently selected:"
 PDT_ERR_SEL_3_OBJS    = "Select Exactly 3 Objects (Currently selected:"
 PDT_ERR_SEL_4_OBJS    = "Select Exactly 4 Objects (Currently selected:"
+PDT_ERR_SEL_2_MESHES  = "Select at Least 2 Mesh Objects (Currently selected:"
+PDT_ERR_NO_OBJECT     = "No Object Named:"
+PDT_ERR_NOT_MESH      = "Edit Mode needs a Mesh Object:"
+PDT_ERR_ZERO_SCALE    = "Object has a Zero Scale, its Geometry cannot be Transformed:"
+PDT_ERR_NO_SAVE_PATH  = "No File to Save to, give an Output File"
+PDT_ERR_JOB_RUNNING   = "Wait for, or Cancel (Esc), the Running Job:"
 
 PDT_ERR_FACE_SEL      = "You have a Face Selected, this would have ruined the Topology"
 
@@ -107,6 +125,7 @@ PDT_ERR_CONNECTED     = "Vertices are already Connected"
 PDT_ERR_EDIT_MODE     = "Only Works in EDIT Mode (Current mode:"
 PDT_ERR_EDOB_MODE     = "Only Works in EDIT, or OBJECT Modes (Current mode:"
 PDT_ERR_TAPER_ANG     = "Angle must be in Range -80 to +80 (Currently set to:"
+PDT_ERR_TAPER_AXIS    = "Custom Taper Axis and Move Direction must not be Zero"
 PDT_ERR_TAPER_SEL     = "Select at Least 2 Vertices Individually - Active is Rotation Point (Currently selected:"
 PDT_ERR_NO3DVIEW      = "View3D not found, cannot run operator"
 PDT_ERR_SCALEZERO     = "Scale Distance is 0"
@@ -115,6 +134,9 @@ PDT_ERR_CHARS_NUM     = "Bad Command Format, not enough Characters"
 PDT_ERR_BADFLETTER    = "Bad Operator (1st Letter); C D E F G N M P S V or ? only"
 PDT_ERR_BADSLETTER    = "Bad Mode (2nd Letter); A D I or P only (+ X Y & Z for Maths) (+ V & G for Fillet)"
 PDT_ERR_BADMATHS      = "Not a Valid Mathematical Expression!"
+PDT_ERR_ARRAY_OPER    = "A Count (*N) is only Valid for Duplicate (D) & Extrude (E) Commands"
+PDT_ERR_ARRAY_COUNT   = "Count (*N) must be a Whole Number, 1 or more"
+PDT_ERR_MATHS_NAME    = "Not Allowed in a Mathematical Expression:"
 PDT_ERR_BADCOORDL     = "X Y & Z Not permitted in anything other than Maths Operations"
 PDT_ERR_BAD1VALS      = "Bad Command - 1 Value needed"
 PDT_ERR_BAD2VALS      = "Bad Command - 2 Values needed"
@@ -130,10 +152,24 @@ PDT_ERR_2CPNPE        = "Select 2 Co-Planar Non-Parallel Edges"
 PDT_ERR_NCEDGES       = "Edges must be Co-Planar Non-Parallel Edges, Selected Edges aren't"
 PDT_ERR_1EDGE1FACE    = "Select 1 face and 1 Detached Edge"
 PDT_ERR_NOINT         = "No Intersection Found, see the Info Panel for Details"
+PDT_ERR_NO_VGROUP     = "No Edges in the Active Vertex Group to use as Cutters"
+PDT_ERR_NO_CUTTERS    = "No Edges in the Selection History to use as Cutters"
+PDT_ERR_NO_BISECT     = "No Pairs of Edges to Bisect"
+PDT_ERR_NO_OPEN_EDGES = "Select Loose Edges with a Free End to Extend"
+PDT_ERR_ETOF_TARGET   = "Select Faces, or a Target Mesh Object other than the Edited one"
+PDT_ERR_NO_SCRIPT     = "Set a Text Block, or a File, holding PDT Commands"
+PDT_ERR_SCRIPT_READ   = "Cannot Read Command File:"
+PDT_ERR_NO_JOURNAL    = "Set a Text Block, or a File, holding a PDT Journal"
+PDT_ERR_JOURNAL       = "Cannot Write Journal File:"
+PDT_ERR_JOURNAL_LINE  = "Bad Journal Entry, expected: Plane Mode Command"
+PDT_ERR_ETOF_HITS     = "No Selected Edge Points at a Target Face"
 
 # Info messages
 #
 PDT_INF_OBJ_MOVED     = "Active Object Moved to Intersection, "
+PDT_INF_SCRIPT        = "Commands Run without Error:"
+PDT_INF_JOB_CANCEL    = "Cancelled, Changes Undone:"
+PDT_INF_TJUNCTIONS    = "T-Junctions Repaired:"
 
 # Confirm Messages
 #
@@ -169,3 +205,17 @@ PDT_DES_FILLETRAD     = "Fillet Radius"
 PDT_DES_FILLETSEG     = "Number of Fillet Segments"
 PDT_DES_FILLETPROF    = "Fillet Profile"
 PDT_DES_FILLETVERTS   = "Use Vertices, or Edges, Set to False for Extruded Geometry"
+PDT_DES_XALLCUT       = "Edges that Cut the other Selected Edges (All Edges: Intersect Everything)"
+PDT_DES_BISECTPAIRS   = "Edges that are Bisected in Pairs"
+PDT_DES_PIVOTCENTRE   = "Centre of the Selection used by Pivot to Selection"
+PDT_DES_TAPERAXIS     = "Custom Taper Axis (World), through the Pivot Point"
+PDT_DES_TAPERMOVE     = "Custom Taper Move Direction (World)"
+PDT_DES_CMDTEXT       = "Text Block holding PDT Commands, one per Line"
+PDT_DES_CMDFILE       = "File holding PDT Commands, one per Line (used if no Text Block is set)"
+PDT_DES_JOURNAL       = "Record every Command run, with its resolved Values, Working Plane & Move Mode"
+PDT_DES_JOURNALTEXT   = "Text Block holding the Command Journal"
+PDT_DES_JOURNALFILE   = "File holding the Command Journal (used instead of the Text Block when set)"
+PDT_DES_ETOFTARGET    = "Faces that Edge-Face Extends Edges to"
+PDT_DES_ETOFOBJECT    = "Mesh Object whose Faces Edges are Extended to"
+PDT_DES_TJUNCDIST     = "Distance under which a Vertex is Joined to the Edge it lies on"
+PDT_DES_XALLWORKERS   = "Worker Processes for Intersect All on Large Selections (1 = Run in Blender only)"
@@ -23,20 +23,66 @@
 #
 import bpy
 import bmesh
+import numpy as np
 from bpy.types import Operator, SpaceView3D
 from mathutils import Vector, Matrix
 from math import pi
-from .pdt_functions import viewCoords, drawCallback3D
+from bpy.app.handlers import persistent
+from . import pdt_cad_module as cm
+from .pdt_functions import (
+    ViewTransform,
+    drawCallback3D,
+    pivot_mark_dirty,
+    pivot_redraw,
+)
 from .pdt_msg_strings import (
     PDT_CON_AREYOURSURE,
     PDT_ERR_EDIT_MODE,
     PDT_ERR_NO3DVIEW,
     PDT_ERR_NOPPLOC,
     PDT_ERR_NO_ACT_OBJ,
-    PDT_ERR_NO_SEL_GEOM
+    PDT_ERR_NO_SEL_FACES,
+    PDT_ERR_NO_SEL_GEOM,
+    PDT_ERR_ZERO_SCALE
 )
 
 
+# Owner of the msgbus subscriptions made while the Pivot Point is shown
+_msgbus_owner = object()
+
+
+def pivot_subscribe(pg_type):
+    """Redraw the Pivot Point when its PDT Properties change.
+
+    The location & size only change the transform used when drawing, the width &
+    alpha rebuild the cached graphic.
+
+    Args:
+        pg_type: PDTSceneProperties class.
+
+    Returns:
+        Nothing.
+    """
+
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for prop, notify in (
+        ("pivot_loc", pivot_redraw),
+        ("pivot_size", pivot_redraw),
+        ("pivot_width", pivot_mark_dirty),
+        ("pivot_alpha", pivot_mark_dirty),
+    ):
+        bpy.msgbus.subscribe_rna(
+            key=(pg_type, prop), owner=_msgbus_owner, args=(), notify=notify
+        )
+
+
+@persistent
+def pivot_resubscribe(*args):
+    """Subscribe again after a File Load, which drops msgbus subscriptions."""
+    pivot_subscribe(type(bpy.context.scene.pdt_pg))
+    pivot_mark_dirty()
+
+
 class PDT_OT_ModalDrawOperator(bpy.types.Operator):
     """Show/Hide Pivot Point."""
 
@@ -62,6 +108,9 @@ class PDT_OT_ModalDrawOperator(bpy.types.Operator):
             PDT_OT_ModalDrawOperator._handle = SpaceView3D.draw_handler_add(
                 drawCallback3D, (self, context), "WINDOW", "POST_VIEW"
             )
+            pivot_subscribe(type(context.scene.pdt_pg))
+            bpy.app.handlers.load_post.append(pivot_resubscribe)
+            pivot_mark_dirty()
             context.window_manager.pdt_run_opengl = True
 
     @staticmethod
@@ -79,6 +128,9 @@ class PDT_OT_ModalDrawOperator(bpy.types.Operator):
 
         if PDT_OT_ModalDrawOperator._handle is not None:
             SpaceView3D.draw_handler_remove(PDT_OT_ModalDrawOperator._handle, "WINDOW")
+        bpy.msgbus.clear_by_owner(_msgbus_owner)
+        if pivot_resubscribe in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(pivot_resubscribe)
         PDT_OT_ModalDrawOperator._handle = None
         context.window_manager.pdt_run_opengl = False
 
@@ -151,7 +203,7 @@ class PDT_OT_ViewPlaneRotate(Operator):
             return {"FINISHED"}
         bm = bmesh.from_edit_mesh(obj.data)
         v1 = Vector((0, 0, 0))
-        v2 = viewCoords(0, 0, 1)
+        v2 = ViewTransform().to_world((0, 0, 1))
         axis = (v2 - v1).normalized()
         rot = Matrix.Rotation((pg.pivot_ang * pi / 180), 4, axis)
         verts = verts = [v for v in bm.verts if v.select]
@@ -179,8 +231,9 @@ class PDT_OT_ViewPlaneScale(Operator):
     def execute(self, context):
         """Scales Selected Vertices about Pivot Point.
 
-        Scales any selected vertices about the Pivot Point
-        in View Oriented coordinates, works in any view orientation
+        Scales any selected vertices about the Pivot Point along the World axes,
+        as one affine transform through the full object matrix, so rotated, scaled
+        and parented objects are scaled as they are shown
 
         Args:
             context: Blender bpy.context instance.
@@ -202,20 +255,17 @@ class PDT_OT_ViewPlaneScale(Operator):
             errmsg = f"{PDT_ERR_EDIT_MODE} {obj.mode})"
             self.report({"ERROR"}, errmsg)
             return {"FINISHED"}
+        if obj.matrix_world.determinant() == 0.0:
+            self.report({"ERROR"}, f"{PDT_ERR_ZERO_SCALE} {obj.name}")
+            return {"FINISHED"}
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = verts = [v for v in bm.verts if v.select]
-        for v in verts:
-            dx = (pg.pivot_loc.x - obj.matrix_world.decompose()[0].x - v.co.x) * (
-                1 - pg.pivot_scale.x
-            )
-            dy = (pg.pivot_loc.y - obj.matrix_world.decompose()[0].y - v.co.y) * (
-                1 - pg.pivot_scale.y
-            )
-            dz = (pg.pivot_loc.z - obj.matrix_world.decompose()[0].z - v.co.z) * (
-                1 - pg.pivot_scale.z
-            )
-            dv = Vector((dx, dy, dz))
-            v.co = v.co + dv
+        verts = [v for v in bm.verts if v.select]
+        pivot = Matrix.Translation(pg.pivot_loc)
+        scale = Matrix.Diagonal(pg.pivot_scale).to_4x4()
+        # space maps the World space scale into Object space: M^-1 @ matrix @ M
+        bmesh.ops.transform(
+            bm, matrix=pivot @ scale @ pivot.inverted(), space=obj.matrix_world, verts=verts
+        )
         bmesh.update_edit_mesh(obj.data)
         return {"FINISHED"}
 
@@ -268,6 +318,50 @@ class PDT_OT_CursorToPivot(Operator):
         return {"FINISHED"}
 
 
+def selection_centre(objects, mode):
+    """Return the World Space Centre of the Selection of Objects in Edit mode.
+
+    Args:
+        objects: Mesh Objects in Edit mode, each with its own mesh data
+        mode: "MEDIAN" for the mean of the selected vertices, "BOUNDS" for the
+              centre of their bounding box, "AREA" for the area weighted centroid
+              of the selected faces.
+
+    Returns:
+        Vector, or None if nothing suitable is selected.
+    """
+
+    points = []
+    weights = []
+    for obj in objects:
+        bm = bmesh.from_edit_mesh(obj.data)
+        snapshot = cm.GeometrySnapshot.from_bmesh(bm).transformed(obj.matrix_world)
+        if mode == "AREA":
+            tris = [tri for tri in bm.calc_loop_triangles() if tri[0].face.select]
+            tri_verts = np.fromiter(
+                (loop.vert.index for tri in tris for loop in tri),
+                dtype=np.int64,
+                count=len(tris) * 3,
+            )
+            coords = snapshot.vert_coords(tri_verts).reshape(-1, 3, 3)
+            cross = np.cross(coords[:, 1] - coords[:, 0], coords[:, 2] - coords[:, 0])
+            weights.append(np.sqrt(np.einsum("ij,ij->i", cross, cross)))
+            points.append(coords.mean(axis=1))
+        else:
+            points.append(snapshot.vert_coords(snapshot.selected_verts()))
+    points = np.concatenate(points) if points else np.empty((0, 3))
+    if len(points) == 0:
+        return None
+    if mode == "AREA":
+        weights = np.concatenate(weights)
+        if weights.sum() == 0:
+            return None
+        return Vector(np.average(points, axis=0, weights=weights))
+    if mode == "BOUNDS":
+        return Vector((points.min(axis=0) + points.max(axis=0)) / 2)
+    return Vector(points.mean(axis=0))
+
+
 class PDT_OT_PivotSelected(Operator):
     """Set Pivot Point to Selected Geometry."""
 
@@ -285,12 +379,15 @@ class PDT_OT_PivotSelected(Operator):
     def execute(self, context):
         """Moves Pivot Point centroid of Selected Geometry.
 
-        Moves Pivot Point centroid of Selected Geometry in active scene
-        using Snap_Cursor_To_Selected, then puts cursor back to original location.
+        Moves Pivot Point to the centre of the Selected Geometry of every Object in
+        Edit mode, computed from their World coordinates, see selection_centre.
 
         Args:
             context: Blender bpy.context instance.
 
+        Note:
+            Uses pg.pivot_centre scene variable
+
         Returns:
             Status Set.
         """
@@ -305,17 +402,16 @@ class PDT_OT_PivotSelected(Operator):
             errmsg = f"{PDT_ERR_EDIT_MODE} {obj.mode})"
             self.report({"ERROR"}, errmsg)
             return {"FINISHED"}
-        bm = bmesh.from_edit_mesh(obj.data)
-        verts = verts = [v for v in bm.verts if v.select]
-        if len(verts) > 0:
-            old_cursor_loc = scene.cursor.location.copy()
-            bpy.ops.view3d.snap_cursor_to_selected()
-            pg.pivot_loc = scene.cursor.location
-            scene.cursor.location = old_cursor_loc
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, PDT_ERR_NO_SEL_GEOM)
+        objects = [ob for ob in context.objects_in_mode_unique_data if ob.type == "MESH"]
+        centre = selection_centre(objects, pg.pivot_centre)
+        if centre is None:
+            if pg.pivot_centre == "AREA":
+                self.report({"ERROR"}, PDT_ERR_NO_SEL_FACES)
+            else:
+                self.report({"ERROR"}, PDT_ERR_NO_SEL_GEOM)
             return {"FINISHED"}
+        pg.pivot_loc = centre
+        return {"FINISHED"}
 
 
 class PDT_OT_PivotOrigin(Operator):
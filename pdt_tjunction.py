@@ -0,0 +1,137 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+#
+# <pep8 compliant>
+#
+# ----------------------------------------------------------
+# Author: Zeffii
+# Modified by: Alan Odom (Clockmender) & Rune Morling (ermo)
+# ----------------------------------------------------------
+#
+#
+import bpy
+import bmesh
+from collections import defaultdict
+from mathutils import Vector
+from . import pdt_cad_module as cm
+from .pdt_xall import split_edges
+from .pdt_msg_strings import (
+    PDT_ERR_EDIT_MODE,
+    PDT_INF_TJUNCTIONS
+)
+
+
+def find_t_junctions(snapshot, vert_indices, edge_indices, tol):
+    """Find Vertices lying inside other Edges.
+
+    The edges' bounding boxes are registered in a uniform grid and every vertex is
+    only tested against the edges sharing its cell.
+
+    Args:
+        snapshot:     pdt_cad_module.GeometrySnapshot of the mesh
+        vert_indices: array of vertex indices to test
+        edge_indices: array of edge indices to test against
+        tol:          distance under which a vertex is considered on an edge.
+
+    Returns:
+        Dictionary of edge index and list of vertex indices found inside that edge.
+    """
+
+    points = snapshot.vert_coords(vert_indices)
+    coords = snapshot.edge_coords(edge_indices)
+    pairs = cm.points_in_bounds(points, coords.min(axis=1), coords.max(axis=1), tol)
+    _, on_edge = cm.points_on_edges(points, coords, pairs, tol)
+
+    junctions = defaultdict(list)
+    hits = pairs[on_edge]
+    hit_edges = edge_indices[hits[:, 1]].tolist()
+    hit_verts = vert_indices[hits[:, 0]].tolist()
+    for edge_idx, vert_idx in zip(hit_edges, hit_verts):
+        junctions[edge_idx].append(vert_idx)
+    return junctions
+
+
+def repair_t_junctions(bm, junctions, tol):
+    """Split Edges at the Vertices lying inside them.
+
+    Args:
+        bm:           is a bmesh representation
+        junctions:    dictionary from find_t_junctions
+        tol:          tolerance junctions were found with, see split_edges.
+
+    Returns:
+        List of edges created by the splits.
+    """
+
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+    shared = {}
+    edge_cuts = []
+    for edge_idx, vert_list in junctions.items():
+        cuts = []
+        for vert_idx in vert_list:
+            vert = shared.setdefault(vert_idx, bm.verts[vert_idx])
+            cuts.append((Vector(vert.co), vert_idx))
+        edge_cuts.append((bm.edges[edge_idx], cuts))
+    new_edges = split_edges(bm, edge_cuts, shared, tol)
+    bm.normal_update()
+    return new_edges
+
+
+class PDT_OT_RepairTJunctions(bpy.types.Operator):
+    """Split Selected Edges at Selected Vertices lying inside them."""
+
+    bl_idname = "pdt.tjunctions"
+    bl_label = "Repair T-Junctions"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        if ob is None:
+            return False
+        return ob.type == "MESH" and ob.mode == "EDIT"
+
+    def execute(self, context):
+        """Joins every Selected Vertex to the Selected Edges it lies on.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        obj = context.active_object
+        if obj.mode != "EDIT":
+            self.report({"ERROR"}, PDT_ERR_EDIT_MODE + obj.mode + ")")
+            return {"FINISHED"}
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        snapshot = cm.GeometrySnapshot.from_bmesh(bm)
+        tol = context.scene.pdt_pg.tjunction_dist
+        junctions = find_t_junctions(
+            snapshot, snapshot.selected_verts(), snapshot.selected_edges(), tol
+        )
+        count = 0
+        if junctions:
+            # Only count the cuts made, split_edges skips the ones too close together
+            count = len(repair_t_junctions(bm, junctions, tol))
+            bmesh.update_edit_mesh(obj.data)
+        self.report({"INFO"}, f"{PDT_INF_TJUNCTIONS} {count}")
+        return {"FINISHED"}
@@ -25,10 +25,59 @@
 #
 import bpy
 import bmesh
-from mathutils.geometry import intersect_line_line as LineIntersect
-import itertools
+import multiprocessing
+import numpy as np
+from mathutils import Vector
+from mathutils.kdtree import KDTree
 from collections import defaultdict
+from contextlib import nullcontext
+from itertools import chain
+from gpu_extras.batch import batch_for_shader
 from . import pdt_cad_module as cm
+from .pdt_functions import draw_batch, shader
+from .pdt_jobs import JobOperator, run_job
+from .pdt_msg_strings import (
+    PDT_ERR_EDIT_MODE,
+    PDT_ERR_EDOB_MODE,
+    PDT_ERR_NO_CUTTERS,
+    PDT_ERR_NO_VGROUP,
+    PDT_ERR_SEL_2_MESHES,
+    PDT_ERR_ZERO_SCALE
+)
+
+# Points closer than this are welded into one vertex
+MERGE_DIST = 0.0001
+
+# Look of the Intersect All preview points
+PREVIEW_COLOUR = (1.0, 0.5, 0.0, 1.0)
+PREVIEW_POINT_SIZE = 6
+
+# Below this many candidate pairs a process pool costs more than it saves
+POOL_MIN_PAIRS = 50000
+
+# Candidate pairs intersected between two progress reports of a job
+JOB_PAIRS = 4 * POOL_MIN_PAIRS
+
+# Per object cache of edges with no intersections left, keyed by object name
+# and holding (mesh pointer, vertex count, set of edge keys)
+_clean_edges = {}
+
+# Cached preview batch and the selection signature it was built from
+_preview = {"dirty": True, "signature": None, "batch": None}
+
+# Edge coordinates shared with the pool workers, set by _init_worker
+_shared_coords = None
+
+
+def _init_worker(raw_coords, shape):
+    """Attach a Pool Worker to the Shared Edge Coordinates."""
+    global _shared_coords
+    _shared_coords = np.frombuffer(raw_coords, dtype=np.float64).reshape(shape)
+
+
+def _intersect_tile(pairs):
+    """Intersect one Tile of Candidate Pairs in a Pool Worker."""
+    return cm.intersect_edge_pairs(_shared_coords, pairs)
 
 
 def order_points(edge, point_list):
@@ -42,70 +91,305 @@ def order_points(edge, point_list):
     return [v1] + point_list + [v2]
 
 
-def remove_permutations_that_share_a_vertex(bm, permutations):
-    """Get useful Permutations."""
+def get_valid_permutations(coords, vert_indices, dirty=None, cutters=None, owners=None):
+    """Get useful Permutations.
+
+    Only pairs of edges whose bounding boxes overlap can intersect, so candidate
+    pairs come from a uniform grid built over the edges rather than from every
+    ordered pair of the selection. Pairs that share a vertex are dropped.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        vert_indices: (N, 2) array of the edges' vertex indices
+        dirty:        optional (N,) bool array, when given only pairs with at least
+                      one dirty edge are kept
+        cutters:      optional (N,) bool array, when given only pairs of one cutter
+                      and one non cutter edge are kept
+        owners:       optional (N,) int array, when given only pairs of edges with
+                      different owners are kept.
+
+    Returns:
+        (P, 2) array of index pairs into coords.
+    """
+
+    pairs = cm.overlapping_bounds(coords.min(axis=1), coords.max(axis=1))
+    if dirty is not None:
+        pairs = pairs[dirty[pairs[:, 0]] | dirty[pairs[:, 1]]]
+    if cutters is not None:
+        pairs = pairs[cutters[pairs[:, 0]] != cutters[pairs[:, 1]]]
+    if owners is not None:
+        pairs = pairs[owners[pairs[:, 0]] != owners[pairs[:, 1]]]
+    va = vert_indices[pairs[:, 0]]
+    vb = vert_indices[pairs[:, 1]]
+    shared = (va[:, :1] == vb).any(axis=1) | (va[:, 1:] == vb).any(axis=1)
+    return pairs[~shared]
+
+
+def split_into_tiles(coords, pairs, num_tiles):
+    """Group Candidate Pairs by Spatial Tile.
+
+    Each pair belongs to the tile holding the minimum corner of the overlap of its
+    edges' bounding boxes, so every pair is assigned to exactly one tile.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of index pairs into coords
+        num_tiles:    approximate number of tiles wanted.
+
+    Returns:
+        List of arrays of positions into pairs, one per non-empty tile.
+    """
+
+    mins = coords.min(axis=1)
+    corner = np.maximum(mins[pairs[:, 0]], mins[pairs[:, 1]])
+    low = corner.min(axis=0)
+    size = np.maximum(corner.max(axis=0) - low, 1.0e-9)
+    per_axis = max(1, int(round(num_tiles ** (1.0 / 3.0))))
+    cells = np.minimum(((corner - low) / size * per_axis).astype(np.int64), per_axis - 1)
+    tile_ids = cells[:, 0] + per_axis * (cells[:, 1] + per_axis * cells[:, 2])
+    order = np.argsort(tile_ids, kind="stable")
+    bounds = np.flatnonzero(np.diff(tile_ids[order])) + 1
+    return np.split(order, bounds)
+
+
+def worker_pool(coords, workers, num_pairs):
+    """Start a Process Pool sharing the Edge Coordinates.
+
+    The edge coordinates are exported once to a shared memory array that every
+    worker attaches to, so one pool can intersect any number of batches of pairs.
+    The pool needs the "fork" start method.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        workers:      number of worker processes
+        num_pairs:    number of candidate pairs to be intersected.
+
+    Returns:
+        Pool, or None where it is not worth it or not available.
+    """
+
+    if (
+        workers <= 1
+        or num_pairs < POOL_MIN_PAIRS
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return None
+    raw_coords = multiprocessing.RawArray("d", coords.size)
+    np.frombuffer(raw_coords, dtype=np.float64)[:] = coords.ravel()
+    ctx = multiprocessing.get_context("fork")
+    return ctx.Pool(workers, initializer=_init_worker, initargs=(raw_coords, coords.shape))
+
+
+def intersect_pairs(coords, pairs, workers=1, pool=None):
+    """Intersect Candidate Pairs, optionally sharded over a Process Pool.
+
+    The pairs are split into spatial tiles and each tile is intersected by a pool
+    worker. Results are written back by pair position, so they do not depend on the
+    worker count. Without a pool one is started for this call, see worker_pool;
+    where none is started the pairs are intersected in this process.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        pairs:        (P, 2) array of index pairs into coords
+        workers:      number of worker processes
+        pool:         optional Pool from worker_pool for these coords, kept open.
+
+    Returns:
+        Same as pdt_cad_module.intersect_edge_pairs.
+    """
+
+    if pool is None:
+        pool = worker_pool(coords, workers, len(pairs))
+        if pool is None:
+            return cm.intersect_edge_pairs(coords, pairs)
+        with pool:
+            return intersect_pairs(coords, pairs, workers, pool)
+
+    tiles = split_into_tiles(coords, pairs, workers * 4)
+    results = pool.map(_intersect_tile, [pairs[tile] for tile in tiles])
+
+    points = np.empty((len(pairs), 3), dtype=np.float64)
+    factors = np.empty((len(pairs), 2), dtype=np.float64)
+    mask = np.empty(len(pairs), dtype=bool)
+    for tile, (tile_points, tile_factors, tile_mask) in zip(tiles, results):
+        points[tile] = tile_points
+        factors[tile] = tile_factors
+        mask[tile] = tile_mask
+    return points, factors, mask
+
+
+def edge_keys(coords, vert_indices):
+    """Return a Hashable Key per Edge.
+
+    The key holds the exact end point coordinates and vertex indices of the edge,
+    so it changes whenever the edge moves or its vertices are renumbered, which
+    happens as soon as geometry is deleted or merged.
+
+    Args:
+        coords:       (N, 2, 3) array of edge end points
+        vert_indices: (N, 2) array of the edges' vertex indices.
+
+    Returns:
+        List of N bytes objects.
+    """
+
+    rows = np.ascontiguousarray(
+        np.column_stack((coords.reshape(-1, 6), vert_indices.astype(np.float64)))
+    )
+    return rows.view(np.dtype((np.void, rows.shape[1] * rows.itemsize))).ravel().tolist()
+
+
+def get_clean_edges(cache_key, bm):
+    """Return the Keys of Edges known to have no Intersections left.
+
+    Args:
+        cache_key:    name of the object owning bm
+        bm:           is a bmesh representation.
+
+    Returns:
+        Set of edge keys, empty if nothing valid is cached.
+    """
+
+    entry = _clean_edges.get(cache_key)
+    if entry is None:
+        return set()
+    mesh_ptr, num_verts, keys = entry
+    if mesh_ptr != _mesh_pointer(cache_key) or len(bm.verts) < num_verts:
+        # Mesh replaced, or vertices removed and everything renumbered
+        del _clean_edges[cache_key]
+        return set()
+    return keys
+
+
+def remember_clean_edges(cache_key, bm, edges):
+    """Cache the Keys of Edges that no longer Intersect each other.
+
+    Args:
+        cache_key:    name of the object owning bm
+        bm:           is a bmesh representation
+        edges:        list of BMEdges left by a complete Intersect All run.
 
-    final_permutations = []
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        if len(set(raw_vert_indices)) < 4:
-            continue
+    Returns:
+        Nothing.
+    """
 
-        # reaches this point if they do not share.
-        final_permutations.append(edges)
+    snapshot = cm.GeometrySnapshot.from_bmesh(bm)
+    edge_indices = [edge.index for edge in edges if edge.is_valid]
+    coords = snapshot.edge_coords(edge_indices)
+    vert_indices = snapshot.edge_verts(edge_indices)
+    _clean_edges[cache_key] = (
+        _mesh_pointer(cache_key),
+        len(bm.verts),
+        set(edge_keys(coords, vert_indices)),
+    )
 
-    return final_permutations
 
+def forget_clean_edges(cache_key):
+    """Drop the Cached Edges of an Object."""
+    _clean_edges.pop(cache_key, None)
 
-def get_valid_permutations(bm, edge_indices):
-    """Get useful Permutations."""
 
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(bm, permutations)
+def _mesh_pointer(cache_key):
+    """Return the Address of the Object's Mesh Data, None if it is gone."""
+    obj = bpy.data.objects.get(cache_key)
+    return obj.data.as_pointer() if obj is not None and obj.data is not None else None
 
 
-def can_skip(closest_points, vert_vectors):
-    """Check if the intersection lies on both edges and return True
-    when criteria are not met, and thus this point can be skipped."""
+def get_intersection_dictionary(bm, edge_indices, workers=1, cache_key=None, cutter_indices=None):
+    """Return a dictionary of edge indices and points found on those edges.
 
-    if not closest_points:
-        return True
-    if not isinstance(closest_points[0].x, float):
-        return True
-    if cm.num_edges_point_lies_on(closest_points[0], vert_vectors) < 2:
-        return True
+    Runs intersection_steps to the end, see there for the arguments.
+    """
 
-    # if this distance is larger than than 1.0e-5, we can skip it.
-    cpa, cpb = closest_points
-    return (cpa - cpb).length > 1.0e-5
+    return run_job(intersection_steps(bm, edge_indices, workers, cache_key, cutter_indices))
 
 
-def get_intersection_dictionary(bm, edge_indices):
-    """Return a dictionary of edge indices and points found on those edges."""
+def intersection_steps(bm, edge_indices, workers=1, cache_key=None, cutter_indices=None):
+    """Find the points on edges where they intersect, as a job generator.
+
+    The candidate pairs are intersected JOB_PAIRS at a time, with the progress
+    yielded after each batch.
+
+    When cache_key is given, edges remembered as clean by the last run on that
+    object are not tested against each other, only new or moved edges are tested
+    against the whole selection.
+
+    When cutter_indices is given, edges are only tested against the cutter edges,
+    crossings between two cutters, or between two other edges, are left alone.
+
+    Args:
+        bm:             is a bmesh representation
+        edge_indices:   list of edge indices to intersect
+        workers:        number of worker processes, see worker_pool
+        cache_key:      optional object name for the re-intersection cache
+        cutter_indices: optional list of cutter edge indices.
+
+    Yields:
+        Progress, from 0.0 to 1.0.
+
+    Returns:
+        Dictionary of edge index and ordered list of points, including the edge's
+        own vertices at each end.
+    """
 
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(bm, edge_indices)
+    cutters = None
+    if cutter_indices is not None:
+        edge_indices = sorted(set(edge_indices).union(cutter_indices))
+        cutters = np.isin(edge_indices, list(cutter_indices))
+    else:
+        edge_indices = sorted(edge_indices)
+    snapshot = cm.GeometrySnapshot.from_bmesh(bm)
+    coords = snapshot.edge_coords(edge_indices)
+    vert_indices = snapshot.edge_verts(edge_indices)
+
+    dirty = None
+    if cache_key is not None:
+        clean = get_clean_edges(cache_key, bm)
+        if clean:
+            keys = edge_keys(coords, vert_indices)
+            dirty = np.fromiter((key not in clean for key in keys), dtype=bool, count=len(keys))
+
+    permutations = get_valid_permutations(coords, vert_indices, dirty, cutters)
+    yield 0.1
+    points = np.empty((len(permutations), 3), dtype=np.float64)
+    hits = np.empty(len(permutations), dtype=bool)
+    # One pool for the whole job, the batches only keep the job responsive
+    pool = worker_pool(coords, workers, len(permutations))
+    with pool or nullcontext():
+        for start in range(0, len(permutations), JOB_PAIRS):
+            stop = min(start + JOB_PAIRS, len(permutations))
+            points[start:stop], _, hits[start:stop] = intersect_pairs(
+                coords, permutations[start:stop], workers, pool
+            )
+            yield 0.1 + 0.8 * stop / len(permutations)
 
     k = defaultdict(list)
-    d = defaultdict(list)
 
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        vert_vectors = cm.vectors_from_indices(bm, raw_vert_indices)
+    # only pairs whose intersection happens on both edges remain.
+    for (idx1, idx2), co in zip(permutations[hits].tolist(), points[hits].tolist()):
+        point = Vector(co)
+        k[edge_indices[idx1]].append(point)
+        k[edge_indices[idx2]].append(point)
+
+    return order_intersections(bm, k)
+
 
-        points = LineIntersect(*vert_vectors)
+def order_intersections(bm, k):
+    """Order the Points found on each Edge.
 
-        # some can be skipped.    (NaN, None, not on both edges)
-        if can_skip(points, vert_vectors):
-            continue
+    Args:
+        bm:           is a bmesh representation
+        k:            dictionary of edge index and unordered list of points.
 
-        # reaches this point only when an intersection happens on both edges.
-        [k[edge].append(points[0]) for edge in edges]
+    Returns:
+        Dictionary of edge index and ordered list of points, including the edge's
+        own vertices at each end.
+    """
 
-    # k will contain a dict of edge indices and points found on those edges.
+    d = defaultdict(list)
     for edge_idx, unordered_points in k.items():
         tv1, tv2 = bm.edges[edge_idx].verts
         v1 = bm.verts[tv1.index].co
@@ -116,25 +400,189 @@ def get_intersection_dictionary(bm, edge_indices):
     return d
 
 
+def get_object_intersections(snapshots, matrices, edge_indices, workers=1):
+    """Return the Intersections between the Edges of several Objects.
+
+    Edges are transformed to world space and intersected against the edges of the
+    other objects only, using the same grid of bounding boxes as a single object.
+    Every point is returned in the local space of each object it cuts.
+
+    Args:
+        snapshots:    list of pdt_cad_module.GeometrySnapshot, one per object
+        matrices:     list of the objects' world matrices
+        edge_indices: list of arrays of edge indices to intersect, one per object
+        workers:      number of worker processes, see intersect_pairs.
+
+    Returns:
+        List of dictionaries, one per object, of edge index and unordered list of
+        points, see order_intersections.
+    """
+
+    coords = []
+    vert_indices = []
+    owners = []
+    offset = 0
+    for owner, (snapshot, matrix, indices) in enumerate(zip(snapshots, matrices, edge_indices)):
+        coords.append(snapshot.transformed(matrix).edge_coords(indices))
+        # Offset vertex indices so only vertices of one object can be shared
+        vert_indices.append(snapshot.edge_verts(indices).astype(np.int64) + offset)
+        owners.append(np.full(len(indices), owner, dtype=np.int64))
+        offset += len(snapshot.verts)
+    coords = np.concatenate(coords)
+    vert_indices = np.concatenate(vert_indices)
+    owners = np.concatenate(owners)
+    global_indices = list(chain.from_iterable(indices.tolist() for indices in edge_indices))
+
+    permutations = get_valid_permutations(coords, vert_indices, owners=owners)
+    points, _, hits = intersect_pairs(coords, permutations, workers)
+
+    inverses = [matrix.inverted() for matrix in matrices]
+    found = [defaultdict(list) for _ in snapshots]
+    for (idx1, idx2), co in zip(permutations[hits].tolist(), points[hits].tolist()):
+        point = Vector(co)
+        for idx in (idx1, idx2):
+            owner = int(owners[idx])
+            found[owner][global_indices[idx]].append(inverses[owner] @ point)
+
+    return found
+
+
+def split_edges(bm, edge_cuts, shared, merge_dist=MERGE_DIST):
+    """Split Edges in place at Shared Vertices.
+
+    Each edge is cut from its first vertex towards its second with
+    bmesh.utils.edge_split, which keeps the edge's attributes on both halves. The
+    first edge cut at a key creates that key's vertex, every later cut at the same
+    key is spliced into it, so crossing edges end up sharing one vertex. Cuts within
+    merge_dist of the previous cut, or once less than merge_dist of the edge is
+    left, are skipped.
+
+    Args:
+        bm:           is a bmesh representation
+        edge_cuts:    list of (BMEdge, list of (point Vector, key)) tuples
+        shared:       dictionary of key and BMVert, updated in place; keys already
+                      present are spliced into their existing vertex
+        merge_dist:   distance under which a cut is skipped.
+
+    Returns:
+        List of edges created by the splits.
+    """
+
+    new_edges = []
+    for edge, cuts in edge_cuts:
+        v_from, v_to = edge.verts
+        start = v_from.co.copy()
+        cuts = sorted(cuts, key=lambda cut: (cut[0] - start).length)
+        remaining = edge
+        prev_vert = v_from
+        for point, key in cuts:
+            target = shared.get(key)
+            if target is not None and target in remaining.verts:
+                continue
+            span = (v_to.co - prev_vert.co).length
+            if span <= merge_dist or (point - prev_vert.co).length <= merge_dist:
+                continue
+            fac = min(max((point - prev_vert.co).length / span, 0.0), 1.0)
+            new_edge, new_vert = bmesh.utils.edge_split(remaining, prev_vert, fac)
+            new_vert.co = point
+            new_vert.select = new_edge.select = edge.select
+            new_edges.append(new_edge)
+            remaining = remaining if v_to in remaining.verts else new_edge
+            if target is None:
+                shared[key] = new_vert
+                prev_vert = new_vert
+            else:
+                bmesh.utils.vert_splice(new_vert, target)
+                prev_vert = target
+    return new_edges
+
+
 def update_mesh(bm, int_dict):
-    """Make new geometry (delete old first)."""
+    """Split the Intersected Edges in place.
 
-    oe = bm.edges
-    ov = bm.verts
+    Every intersection becomes a single vertex shared by the edges crossing there.
+    Points closer than MERGE_DIST to each other are welded, and points at the end of
+    an edge reuse that edge's vertex, so no mesh wide merge is needed afterwards.
+    The cut edges stay selected.
 
-    new_verts = []
-    collect = new_verts.extend
-    for _, point_list in int_dict.items():
-        num_edges_to_add = len(point_list) - 1
-        for i in range(num_edges_to_add):
-            a = ov.new(point_list[i])
-            b = ov.new(point_list[i + 1])
-            oe.new((a, b))
-            bm.normal_update()
-            collect([a, b])
+    Args:
+        bm:           is a bmesh representation
+        int_dict:     dictionary from get_intersection_dictionary.
 
-    bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if edge.select], context="EDGES")
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+    Returns:
+        List of edges created by the splits.
+    """
+
+    bm.edges.ensure_lookup_table()
+    edge_points = [(bm.edges[idx], point_list[1:-1]) for idx, point_list in int_dict.items()]
+    points = [point for _, point_list in edge_points for point in point_list]
+    if not points:
+        return []
+
+    # Weld points that are within MERGE_DIST of each other into clusters
+    tree = KDTree(len(points))
+    for i, point in enumerate(points):
+        tree.insert(point, i)
+    tree.balance()
+    cluster = [-1] * len(points)
+    for i, point in enumerate(points):
+        if cluster[i] < 0:
+            for _, j, _ in tree.find_range(point, MERGE_DIST):
+                if cluster[j] < 0:
+                    cluster[j] = i
+
+    # Points landing on an edge's own vertex use that vertex for the cluster
+    shared = {}
+    edge_cuts = []
+    i = 0
+    for edge, point_list in edge_points:
+        cuts = []
+        for point in point_list:
+            key = cluster[i]
+            i += 1
+            end = next((v for v in edge.verts if (v.co - point).length <= MERGE_DIST), None)
+            if end is None:
+                cuts.append((points[key], key))
+                continue
+            target = shared.setdefault(key, end)
+            if target is not end and bm.edges.get((end, target)) is None:
+                bmesh.utils.vert_splice(end, target)
+                for other, vert in shared.items():
+                    if vert is end:
+                        shared[other] = target
+        edge_cuts.append((edge, cuts))
+
+    new_edges = split_edges(bm, edge_cuts, shared)
+    bm.normal_update()
+    return new_edges
+
+
+def get_cutter_indices(bm, obj, source):
+    """Return the Indices of the Cutter Edges.
+
+    Args:
+        bm:           is a bmesh representation
+        obj:          the Object owning bm
+        source:       "GROUP" for edges in the active Vertex Group, or "HISTORY" for
+                      edges in the Selection History.
+
+    Returns:
+        List of edge indices.
+    """
+
+    if source == "GROUP":
+        group = obj.vertex_groups.active
+        layer = bm.verts.layers.deform.active
+        if group is None or layer is None:
+            return []
+        index = group.index
+        return [
+            edge.index for edge in bm.edges
+            if all(index in vert[layer] for vert in edge.verts)
+        ]
+    return [
+        elem.index for elem in bm.select_history if isinstance(elem, bmesh.types.BMEdge)
+    ]
 
 
 def unselect_nonintersecting(bm, d_edges, edge_indices):
@@ -146,12 +594,179 @@ def unselect_nonintersecting(bm, d_edges, edge_indices):
             bm.edges[edge].select = False
 
 
-class PDT_OT_IntersectAllEdges(bpy.types.Operator):
-    """Cut Selected Edges at All Intersections."""
+def preview_signature(obj, bm):
+    """Return a Signature of everything the Preview depends on.
+
+    Only the selected edges and the cutter edges are read, not the whole mesh.
+
+    Args:
+        obj:          the Object owning bm
+        bm:           is a bmesh representation.
+
+    Returns:
+        Bytes changing whenever the selected or cutter edges, their coordinates, the
+        Object's transform or the Cutters option change.
+    """
+
+    bm.verts.index_update()
+    bm.edges.index_update()
+    edges = [edge for edge in bm.edges if edge.select]
+    source = bpy.context.scene.pdt_pg.intersect_cutters
+    cutters = []
+    if source != "NONE":
+        # Vertex Group membership, or Selection History order
+        cutters = get_cutter_indices(bm, obj, source)
+        bm.edges.ensure_lookup_table()
+        edges += [bm.edges[idx] for idx in cutters]
+    verts = [vert for edge in edges for vert in edge.verts]
+    coords = np.fromiter(
+        chain.from_iterable(vert.co for vert in verts), dtype=np.float64, count=len(verts) * 3
+    )
+    vert_indices = np.fromiter((vert.index for vert in verts), dtype=np.int64, count=len(verts))
+    return b"".join(
+        (
+            coords.tobytes(),
+            vert_indices.tobytes(),
+            np.array(cutters, dtype=np.int64).tobytes(),
+            np.array(obj.matrix_world, dtype=np.float64).tobytes(),
+            source.encode(),
+        )
+    )
+
+
+def preview_points(obj, bm):
+    """Return World Space Points where Intersect All would cut, without changing bm.
+
+    Args:
+        obj:          the Object owning bm
+        bm:           is a bmesh representation.
+
+    Returns:
+        List of coordinate tuples.
+    """
+
+    edge_indices = [edge.index for edge in bm.edges if edge.select]
+    cutter_indices = None
+    source = bpy.context.scene.pdt_pg.intersect_cutters
+    if source != "NONE":
+        cutter_indices = get_cutter_indices(bm, obj, source)
+        if not cutter_indices:
+            return []
+    # Called from a draw handler, which must never fork a worker pool
+    int_dict = get_intersection_dictionary(bm, edge_indices, 1, obj.name, cutter_indices)
+    points = {tuple(point) for point_list in int_dict.values() for point in point_list[1:-1]}
+    matrix = obj.matrix_world
+    return [tuple(matrix @ Vector(point)) for point in sorted(points)]
+
+
+def preview_mark_dirty(scene, depsgraph=None):
+    """Flag the Preview for a Signature Check after any Depsgraph Update."""
+    _preview["dirty"] = True
+
+
+def draw_preview(self, context):
+    """Draw the Intersect All Preview Points.
+
+    The batch is only rebuilt when a depsgraph update changed the signature of the
+    selection, other redraws reuse the cached batch.
+
+    Args:
+        context: Blender bpy.context instance.
+
+    Returns:
+        Nothing.
+    """
+
+    obj = bpy.context.edit_object
+    if obj is None or obj.type != "MESH":
+        return
+    if _preview["dirty"]:
+        _preview["dirty"] = False
+        bm = bmesh.from_edit_mesh(obj.data)
+        signature = preview_signature(obj, bm)
+        if signature != _preview["signature"]:
+            _preview["signature"] = signature
+            points = preview_points(obj, bm)
+            _preview["batch"] = (
+                batch_for_shader(shader, "POINTS", {"pos": points}) if points else None
+            )
+    if _preview["batch"] is not None:
+        draw_batch(_preview["batch"], PREVIEW_COLOUR, PREVIEW_POINT_SIZE)
+
+
+class PDT_OT_IntersectAllPreview(bpy.types.Operator):
+    """Show/Hide Points where Intersect All will Cut."""
+
+    bl_idname = "pdt.intersectall_preview"
+    bl_label = "Preview Intersect All"
+
+    _handle = None  # keep function handler
+
+    @staticmethod
+    def handle_add(self, context):
+        """Draw Intersect All Preview if not displayed.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Nothing.
+        """
+
+        if PDT_OT_IntersectAllPreview._handle is None:
+            _preview.update(dirty=True, signature=None, batch=None)
+            PDT_OT_IntersectAllPreview._handle = bpy.types.SpaceView3D.draw_handler_add(
+                draw_preview, (self, context), "WINDOW", "POST_VIEW"
+            )
+            bpy.app.handlers.depsgraph_update_post.append(preview_mark_dirty)
+            context.window_manager.pdt_xall_preview = True
+
+    @staticmethod
+    def handle_remove(self, context):
+        """Remove Intersect All Preview if displayed.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Nothing.
+        """
+
+        if PDT_OT_IntersectAllPreview._handle is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(PDT_OT_IntersectAllPreview._handle, "WINDOW")
+        if preview_mark_dirty in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(preview_mark_dirty)
+        PDT_OT_IntersectAllPreview._handle = None
+        _preview.update(dirty=True, signature=None, batch=None)
+        context.window_manager.pdt_xall_preview = False
+
+    def execute(self, context):
+        """Intersect All Preview Show/Hide Button Function.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        if context.window_manager.pdt_xall_preview is False:
+            self.handle_add(self, context)
+        else:
+            self.handle_remove(self, context)
+        if context.area is not None:
+            context.area.tag_redraw()
+        return {"FINISHED"}
+
+
+class PDT_OT_IntersectAllEdges(JobOperator, bpy.types.Operator):
+    """Cut Selected Edges at All Intersections, Esc to Cancel."""
 
     bl_idname = "pdt.intersectall"
     bl_label = "Intersect All Edges"
     bl_options = {"REGISTER", "UNDO"}
+    # The mesh is only cut once all intersections are found
+    job_backup_mesh = False
 
     @classmethod
     def poll(cls, context):
@@ -160,16 +775,17 @@ class PDT_OT_IntersectAllEdges(bpy.types.Operator):
             return False
         return ob is not None and ob.type == "MESH" and ob.mode == "EDIT"
 
-    def execute(self, context):
+    def job(self, context):
         """Computes All intersections with Crossing Geometry.
 
-        Deletes original edges and replaces with new intersected edges
+        Splits the original edges in place at every intersection, once all of them
+        have been found, so a cancelled job leaves the mesh as it was.
 
         Args:
             context: Blender bpy.context instance.
 
-        Returns:
-            Status Set.
+        Yields:
+            Progress, from 0.0 to 1.0.
         """
 
         # must force edge selection mode here
@@ -178,18 +794,122 @@ class PDT_OT_IntersectAllEdges(bpy.types.Operator):
         obj = context.active_object
         if obj.mode == "EDIT":
             bm = bmesh.from_edit_mesh(obj.data)
+            bm.verts.index_update()
+            bm.edges.index_update()
 
             selected_edges = [edge for edge in bm.edges if edge.select]
             edge_indices = [i.index for i in selected_edges]
 
-            int_dict = get_intersection_dictionary(bm, edge_indices)
+            cutter_indices = None
+            source = context.scene.pdt_pg.intersect_cutters
+            if source != "NONE":
+                cutter_indices = get_cutter_indices(bm, obj, source)
+                if not cutter_indices:
+                    msg = PDT_ERR_NO_VGROUP if source == "GROUP" else PDT_ERR_NO_CUTTERS
+                    self.report({"ERROR"}, msg)
+                    return
+
+            workers = context.preferences.addons[__package__].preferences.pdt_xall_workers
+            int_dict = yield from intersection_steps(
+                bm, edge_indices, workers, obj.name, cutter_indices
+            )
 
             unselect_nonintersecting(bm, int_dict.keys(), edge_indices)
-            update_mesh(bm, int_dict)
+            new_edges = update_mesh(bm, int_dict)
+            if cutter_indices is None:
+                remember_clean_edges(obj.name, bm, selected_edges + new_edges)
+            else:
+                # Crossings between non cutter edges were not resolved
+                forget_clean_edges(obj.name)
 
             bmesh.update_edit_mesh(obj.data)
         else:
             msg = PDT_ERR_EDIT_MODE + obj.mode + ")"
             self.report({"ERROR"}, msg)
 
+
+class PDT_OT_IntersectAllObjects(bpy.types.Operator):
+    """Cut Edges of All Selected Objects where they Cross each other."""
+
+    bl_idname = "pdt.intersectall_objects"
+    bl_label = "Intersect All Objects"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        if ob is None:
+            return False
+        return ob.mode in {"EDIT", "OBJECT"}
+
+    def execute(self, context):
+        """Computes Intersections between the Edges of the Selected Objects.
+
+        Edges are compared in world space, each object is split in its own space and
+        the objects are not joined. In Edit mode the selected edges of every object in
+        Edit mode are used, in Object mode all edges of the selected mesh objects.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        mode = context.active_object.mode
+        if mode == "EDIT":
+            objects = [ob for ob in context.objects_in_mode_unique_data if ob.type == "MESH"]
+        elif mode == "OBJECT":
+            objects = [ob for ob in context.selected_objects if ob.type == "MESH"]
+        else:
+            self.report({"ERROR"}, f"{PDT_ERR_EDOB_MODE} {mode})")
+            return {"FINISHED"}
+        # Linked duplicates share one mesh, which can only be split once
+        seen = set()
+        objects = [ob for ob in objects if not (ob.data in seen or seen.add(ob.data))]
+        if len(objects) < 2:
+            self.report({"ERROR"}, f"{PDT_ERR_SEL_2_MESHES} {len(objects)})")
+            return {"FINISHED"}
+        # Points are mapped back to each object through its inverted matrix
+        for ob in objects:
+            if ob.matrix_world.determinant() == 0.0:
+                self.report({"ERROR"}, f"{PDT_ERR_ZERO_SCALE} {ob.name}")
+                return {"FINISHED"}
+
+        # Object mode meshes are read with foreach_get, and only the ones cut are
+        # loaded into a BMesh
+        snapshots = []
+        edge_indices = []
+        for ob in objects:
+            if mode == "EDIT":
+                snapshot = cm.GeometrySnapshot.from_bmesh(bmesh.from_edit_mesh(ob.data))
+                edge_indices.append(snapshot.selected_edges())
+            else:
+                snapshot = cm.GeometrySnapshot.from_mesh(ob.data)
+                edge_indices.append(np.arange(len(snapshot.edges)))
+            snapshots.append(snapshot)
+
+        workers = context.preferences.addons[__package__].preferences.pdt_xall_workers
+        found = get_object_intersections(
+            snapshots, [ob.matrix_world for ob in objects], edge_indices, workers
+        )
+
+        for ob, k in zip(objects, found):
+            if not k:
+                continue
+            if mode == "EDIT":
+                bm = bmesh.from_edit_mesh(ob.data)
+            else:
+                bm = bmesh.new()
+                bm.from_mesh(ob.data)
+            bm.verts.ensure_lookup_table()
+            bm.edges.ensure_lookup_table()
+            update_mesh(bm, order_intersections(bm, k))
+            if mode == "EDIT":
+                bmesh.update_edit_mesh(ob.data)
+            else:
+                bm.to_mesh(ob.data)
+                ob.data.update()
+                bm.free()
+
         return {"FINISHED"}